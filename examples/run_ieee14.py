@@ -1,5 +1,5 @@
 
-import sys, pathlib
+import math, sys, pathlib
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))  # add pack root to path
 
 from powerflow.io.json import load_json_network
@@ -11,4 +11,4 @@ if __name__ == "__main__":
     Vm, Va = res["Vm"], res["Va"]
     print("\n=== RESULTS IEEE14 ===")
     for i,(v,a) in enumerate(zip(Vm, Va)):
-        print(f"Bus {i:2d}: |V|={v:.5f} pu, angle={a*180/3.141592653589793:.3f} deg")
+        print(f"Bus {i:2d}: |V|={v:.5f} pu, angle={math.degrees(a):.3f} deg")
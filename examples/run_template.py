@@ -1,5 +1,5 @@
 
-import sys, pathlib
+import math, sys, pathlib
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
 from powerflow.io.json import load_json_network
 from powerflow.solver.newton_raphson import LoadFlow
@@ -11,7 +11,7 @@ def run(case_name):
     Vm, Va = res["Vm"], res["Va"]
     print(f"\n=== RESULTS {case_name} ===")
     for i,(v,a) in enumerate(zip(Vm, Va)):
-        print(f"Bus {i:3d}: |V|={v:.5f} pu, angle={a*180/3.141592653589793:.3f} deg")
+        print(f"Bus {i:3d}: |V|={v:.5f} pu, angle={math.degrees(a):.3f} deg")
 
 if __name__ == "__main__":
     run("IEEE14.m")
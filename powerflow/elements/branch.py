@@ -1,3 +1,5 @@
+import math
+
 
 class Branch:
     """
@@ -23,11 +25,15 @@ class Branch:
     tap : float
         Transformer tap ratio magnitude, placed on bus i side (default: 1.0).
         For transmission lines, tap = 1.0.
+    shift : float
+        Transformer phase shift angle in radians, placed on bus i side (default: 0.0).
+        For transmission lines, shift = 0.0.
     shift_deg : float
-        Transformer phase shift angle in degrees, placed on bus i side (default: 0.0).
-        For transmission lines, shift_deg = 0.0.
+        Phase shift angle in degrees (read/write view of ``shift``).
     """
-    
+
+    __slots__ = ('i', 'j', 'r', 'x', 'b', 'tap', 'shift')
+
     def __init__(self, i: int, j: int, r: float, x: float, b: float = 0.0, tap: float = 1.0, shift_deg: float = 0.0):
         """
         Initialize a Branch object.
@@ -87,4 +93,13 @@ class Branch:
         self.x = x
         self.b = b            # total line charging susceptance (pu)
         self.tap = tap        # transformer ratio (magnitude), placed on 'i' side
-        self.shift_deg = shift_deg  # phase shift (deg) on 'i' side
+        self.shift = math.radians(shift_deg)  # phase shift (rad) on 'i' side
+
+    @property
+    def shift_deg(self) -> float:
+        """Phase shift angle in degrees."""
+        return math.degrees(self.shift)
+
+    @shift_deg.setter
+    def shift_deg(self, value: float):
+        self.shift = math.radians(value)
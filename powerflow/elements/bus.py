@@ -1,3 +1,4 @@
+import math
 from typing import Optional
 
 
@@ -18,10 +19,16 @@ class BusType:
         Constant for PV (voltage-controlled) bus type.
     PQ : str
         Constant for PQ (load) bus type.
+    CODE : dict of str to int
+        Integer code of each bus type, used by the vectorized network arrays.
+    NAMES : tuple of str
+        Bus type of each integer code (inverse of ``CODE``).
     """
     SLACK = "Slack"
     PV = "PV"
     PQ = "PQ"
+    CODE = {SLACK: 0, PV: 1, PQ: 2}
+    NAMES = (SLACK, PV, PQ)
 
 
 class Bus:
@@ -40,8 +47,10 @@ class Bus:
         Bus type: BusType.SLACK, BusType.PV, or BusType.PQ.
     V : float
         Voltage magnitude in per unit (p.u.). Initial value, may be updated by solver.
+    theta : float
+        Voltage phase angle in radians. Initial value, may be updated by solver.
     theta_deg : float
-        Voltage phase angle in degrees. Initial value, may be updated by solver.
+        Voltage phase angle in degrees (read/write view of ``theta``).
     P : float
         Net injected active power in per unit (p.u.) on system base.
         Positive for generation, negative for load.
@@ -53,7 +62,9 @@ class Bus:
     Qmax : float, optional
         Maximum reactive power limit for PV buses (p.u.). Defaults to None.
     """
-    
+
+    __slots__ = ('idx', 'type', 'V', 'theta', 'P', 'Q', 'Qmin', 'Qmax')
+
     def __init__(
         self,
         idx: int,
@@ -123,10 +134,19 @@ class Bus:
         """
         self.idx = idx        # 0-based index
         self.type = type      # Slack, PV, PQ
-        assert self.type in [BusType.SLACK, BusType.PV, BusType.PQ], "Invalid bus type"
+        assert self.type in BusType.CODE, "Invalid bus type"
         self.V = V            # voltage magnitude (pu)
-        self.theta_deg = theta_deg  # angle (deg)
+        self.theta = math.radians(theta_deg)  # angle (rad)
         self.P = P            # net injected active power (pu on system base)
         self.Q = Q            # net injected reactive power (pu)
         self.Qmin = Qmin      # reactive limits for PV (pu)
         self.Qmax = Qmax
+
+    @property
+    def theta_deg(self) -> float:
+        """Voltage phase angle in degrees."""
+        return math.degrees(self.theta)
+
+    @theta_deg.setter
+    def theta_deg(self, value: float):
+        self.theta = math.radians(value)
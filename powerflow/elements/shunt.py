@@ -22,7 +22,9 @@ class Shunt:
         Susceptance in per unit (p.u.). Defaults to 0.0.
         Positive for capacitive shunts, negative for inductive shunts.
     """
-    
+
+    __slots__ = ('k', 'g', 'b')
+
     def __init__(self, k: int, g: float = 0.0, b: float = 0.0):
         """
         Initialize a Shunt object.
@@ -1,71 +1,92 @@
 import json
-from powerflow.elements.bus import Bus, BusType
-from powerflow.elements.branch import Branch
-from powerflow.elements.shunt import Shunt
+import pathlib
+from powerflow.elements.bus import BusType
 from powerflow.network.network import Network
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
 
-def load_json_network(path, random_noise=False):
+
+def _column(rows, key, dtype, default=None):
+    """
+    Estrae il campo ``key`` da una lista di dizionari come ``np.ndarray``.
+    Se ``default`` non è None, viene usato per le chiavi mancanti.
+    """
+    if default is None:
+        values = (row[key] for row in rows)
+    else:
+        values = (row.get(key, default) for row in rows)
+    return np.fromiter(values, dtype, count=len(rows))
+
+
+def _limit(rows, key, missing):
     """
-    Carica una rete dal formato JSON standardizzato
+    Estrae un limite opzionale (null/assente -> ``missing``) come ``np.ndarray``.
     """
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    values = (missing if row.get(key) is None else row[key] for row in rows)
+    return np.fromiter(values, float, count=len(rows))
+
+
+def load_json_network(path, random_noise=False, seed=None, merge_parallel=False):
+    """
+    Carica una rete dal formato JSON standardizzato.
+    Con ``random_noise=True`` aggiunge un rumore uniforme a V (±0.1 p.u.) e
+    theta (±5°) di tutte le barre tranne lo slack; ``seed`` rende il rumore
+    riproducibile. ``merge_parallel`` è passato a ``Network`` (unisce i rami
+    in parallelo nella Y-bus).
+    """
+    raw = pathlib.Path(path).read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
     base_mva = data.get("base_mva", 100.0)
 
     # --- Buses
-    buses = []
-    for b in data["buses"]:
-        if b["type"].lower() == "slack":
-            t = BusType.SLACK
-        elif b["type"].lower() == "pv":
-            t = BusType.PV
-        else:
-            t = BusType.PQ
-
-        if random_noise:
-            V = b["V"] + np.random.uniform(-0.1, 0.1) if t != BusType.SLACK else b["V"]
-            theta_deg = b["theta_deg"] + np.random.uniform(-5, 5) if t != BusType.SLACK else b["theta_deg"]
-        else:
-            V = b["V"]
-            theta_deg = b["theta_deg"]
+    buses = data["buses"]
+    codes = {"slack": BusType.CODE[BusType.SLACK], "pv": BusType.CODE[BusType.PV]}
+    pq_code = BusType.CODE[BusType.PQ]
+    bus_type_code = np.fromiter(
+        (codes.get(b["type"].lower(), pq_code) for b in buses), np.int8, count=len(buses)
+    )
+    bus_V = _column(buses, "V", float)
+    bus_theta = _column(buses, "theta_deg", float)
 
-        buses.append(
-            Bus(
-                b["id"],
-                t,
-                V,
-                theta_deg,
-                P=b["P"],
-                Q=b["Q"],
-                Qmin=b.get("Qmin", None),
-                Qmax=b.get("Qmax", None),
-            )
-        )
+    if random_noise:
+        rng = np.random.default_rng(seed)
+        nbus = len(buses)
+        slack_mask = bus_type_code == BusType.CODE[BusType.SLACK]
+        V_noise = rng.uniform(-0.1, 0.1, nbus)
+        theta_noise = rng.uniform(-5, 5, nbus)
+        V_noise[slack_mask] = 0.0
+        theta_noise[slack_mask] = 0.0
+        bus_V += V_noise
+        bus_theta += theta_noise
 
     # --- Branches
-    branches = []
-    for br in data["branches"]:
-        branches.append(
-            Branch(
-                br["i"], br["j"],
-                br["r"], br["x"], br["b"],
-                br.get("tap", 1.0),
-                br.get("shift_deg", 0.0),
-            )
-        )
+    branches = data["branches"]
 
     # --- Shunts
-    shunts = []
-    for sh in data.get("shunts", []):
-        shunts.append(
-            Shunt(
-                sh["bus"],
-                sh["g"],
-                sh["b"],
-            )
-        )
+    shunts = data.get("shunts", [])
 
-    return Network(buses, branches, shunts, base_mva)
+    return Network.from_arrays(
+        bus_type_code, bus_V, bus_theta,
+        _column(buses, "P", float),
+        _column(buses, "Q", float),
+        br_i=_column(branches, "i", int),
+        br_j=_column(branches, "j", int),
+        br_r=_column(branches, "r", float),
+        br_x=_column(branches, "x", float),
+        br_b=_column(branches, "b", float),
+        br_tap=_column(branches, "tap", float, 1.0),
+        br_shift_deg=_column(branches, "shift_deg", float, 0.0),
+        bus_Qmin=_limit(buses, "Qmin", -np.inf),
+        bus_Qmax=_limit(buses, "Qmax", np.inf),
+        sh_k=_column(shunts, "bus", int),
+        sh_g=_column(shunts, "g", float),
+        sh_b=_column(shunts, "b", float),
+        bus_idx=_column(buses, "id", np.int32),
+        base_mva=base_mva,
+        merge_parallel=merge_parallel,
+    )
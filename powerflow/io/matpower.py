@@ -1,88 +1,96 @@
 import re
 import numpy as np
-from powerflow.elements.bus import Bus, BusType
-from powerflow.elements.branch import Branch
-from powerflow.elements.shunt import Shunt
+from powerflow.elements.bus import BusType
 from powerflow.network.network import Network
 
 
-def load_matpower(path):
-    """
-    Carica un file MATPOWER .m sia in formato:
-      - mpc = {...} "script mode"
-      - function mpc = caseXX ... end   "function mode"
-    Convertendo automaticamente la funzione in script.
-    """
-    text = open(path, "r", encoding="utf-8").read()
-
-    # --- Caso: file inizia con "function mpc = ..."
-    if re.match(r"^\s*function\s+mpc\s*=", text, re.IGNORECASE):
-        lines = text.splitlines()
-        new = ["mpc = struct();"]
-        started = False
-
-        for line in lines:
-            # salta la riga "function mpc = XXX"
-            if re.match(r"^\s*function\s+mpc\s*=", line, re.IGNORECASE):
-                started = True
-                continue
-            # interrompi a "end"
-            if started and re.match(r"^\s*end\s*$", line, re.IGNORECASE):
-                break
-            if started:
-                new.append(line)
-
-        text = "\n".join(new)
-
-    namespace = {"struct": dict}
-    exec(text, namespace)
-
-    if "mpc" not in namespace:
-        raise ValueError("Il file MATPOWER non definisce mpc")
-
-    mpc = namespace["mpc"]
+_BLOCK_RE = re.compile(r"mpc\.(\w+)\s*=\s*\[(.*?)\]\s*;", re.S)
+_BASEMVA_RE = re.compile(r"mpc\.baseMVA\s*=\s*([-+\d.eE]+)")
 
-    base_mva = float(mpc.get("baseMVA", 100.0))
-    bus = np.array(mpc["bus"], float)
-    branch = np.array(mpc["branch"], float)
-    gen = np.array(mpc.get("gen", []), float)
 
-    buses = []
-    for row in bus:
-        idx = int(row[0]) - 1
-        type_code = int(row[1])
-        Pd, Qd = row[2], row[3]
-        Vm, Va = row[7], row[8]
-
-        if type_code == 3: btype = BusType.SLACK
-        elif type_code == 2: btype = BusType.PV
-        else: btype = BusType.PQ
-
-        buses.append(Bus(idx, btype, Vm, Va, P=-Pd/base_mva, Q=-Qd/base_mva))
-
-    for row in gen:
-        idx = int(row[0]) - 1
-        Pg, Qg, Qmax, Qmin, Vset = row[1:6]
-        buses[idx].P += Pg / base_mva
-        buses[idx].Q += Qg / base_mva
-        buses[idx].Qmax = Qmax / base_mva
-        buses[idx].Qmin = Qmin / base_mva
-        if buses[idx].type in (BusType.SLACK, BusType.PV):
-            buses[idx].V = Vset
-
-    branches = []
-    for row in branch:
-        i, j = int(row[0]) - 1, int(row[1]) - 1
-        r, x, b = row[2], row[3], row[4]
-        tap = row[8] if len(row) > 8 and row[8] != 0 else 1.0
-        shift = row[9] if len(row) > 9 else 0.0
-        branches.append(Branch(i, j, r, x, b, tap, shift))
+def _parse_matrix(block):
+    """
+    Converte il contenuto di una matrice MATLAB (righe separate da ';' o a capo)
+    in un ``np.ndarray`` 2D di float.
+    """
+    rows = [r for r in re.split(r"[;\n]", block) if r.strip()]
+    if not rows:
+        return np.empty((0, 0))
+    ncols = len(rows[0].replace(",", " ").split())
+    values = np.array(block.replace(";", " ").replace(",", " ").split(), float)
+    return values.reshape(-1, ncols)
 
-    shunts = []
-    for row in bus:
-        k = int(row[0]) - 1
-        Gs, Bs = row[4], row[5]
-        if Gs != 0 or Bs != 0:
-            shunts.append(Shunt(k, Gs/base_mva, Bs/base_mva))
 
-    return Network(buses, branches, shunts, base_mva)
+def load_matpower(path, merge_parallel=False):
+    """
+    Carica un file MATPOWER .m, sia in formato "script" (mpc.xxx = ...) sia in
+    formato "function mpc = caseXX".
+    I blocchi numerici (mpc.bus, mpc.gen, mpc.branch, ...) sono letti
+    direttamente con un'espressione regolare, senza interpretare il file.
+    ``merge_parallel`` è passato a ``Network`` (unisce i rami in parallelo
+    nella Y-bus).
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        text = re.sub(r"%.*", "", f.read())  # rimuove i commenti MATLAB
+
+    blocks = dict(_BLOCK_RE.findall(text))
+    if "bus" not in blocks or "branch" not in blocks:
+        raise ValueError("Il file MATPOWER non definisce mpc.bus/mpc.branch")
+
+    m = _BASEMVA_RE.search(text)
+    base_mva = float(m.group(1)) if m else 100.0
+    bus = _parse_matrix(blocks["bus"])
+    branch = _parse_matrix(blocks["branch"])
+    gen = _parse_matrix(blocks.get("gen", ""))
+
+    # --- Buses (MATPOWER: 3 = slack, 2 = PV, 1 = PQ)
+    idx = bus[:, 0].astype(np.int32) - 1
+    mp_type = bus[:, 1].astype(np.int8)
+    code = BusType.CODE
+    bus_type_code = np.where(
+        mp_type == 3, code[BusType.SLACK], np.where(mp_type == 2, code[BusType.PV], code[BusType.PQ])
+    ).astype(np.int8)
+    bus_V = bus[:, 7].copy()
+    bus_P = -bus[:, 2] / base_mva
+    bus_Q = -bus[:, 3] / base_mva
+    bus_Qmin = np.full(len(bus), -np.inf)
+    bus_Qmax = np.full(len(bus), np.inf)
+
+    # --- Generators: injections add up, limits and voltage setpoint are
+    # assigned to the bus
+    if len(gen):
+        g = gen[:, 0].astype(np.int32) - 1
+        np.add.at(bus_P, g, gen[:, 1] / base_mva)
+        np.add.at(bus_Q, g, gen[:, 2] / base_mva)
+        bus_Qmax[g] = gen[:, 3] / base_mva
+        bus_Qmin[g] = gen[:, 4] / base_mva
+        regulated = bus_type_code[g] != code[BusType.PQ]
+        bus_V[g[regulated]] = gen[regulated, 5]
+
+    # --- Branches
+    nbr, ncol = branch.shape
+    tap = branch[:, 8] if ncol > 8 else np.zeros(nbr)
+    tap = np.where(tap != 0, tap, 1.0)
+    shift = branch[:, 9] if ncol > 9 else np.zeros(nbr)
+
+    # --- Shunts (Gs, Bs of the bus data)
+    has_shunt = (bus[:, 4] != 0) | (bus[:, 5] != 0)
+
+    return Network.from_arrays(
+        bus_type_code, bus_V, bus[:, 8], bus_P, bus_Q,
+        br_i=branch[:, 0].astype(np.int32) - 1,
+        br_j=branch[:, 1].astype(np.int32) - 1,
+        br_r=branch[:, 2],
+        br_x=branch[:, 3],
+        br_b=branch[:, 4],
+        br_tap=tap,
+        br_shift_deg=shift,
+        bus_Qmin=bus_Qmin,
+        bus_Qmax=bus_Qmax,
+        sh_k=idx[has_shunt],
+        sh_g=bus[has_shunt, 4] / base_mva,
+        sh_b=bus[has_shunt, 5] / base_mva,
+        bus_idx=idx,
+        base_mva=base_mva,
+        merge_parallel=merge_parallel,
+    )
@@ -0,0 +1,60 @@
+import math
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional, the report falls back to NumPy
+    njit = None
+
+
+def _branch_flows(br_i, br_j, br_r, br_x, br_b, br_tap, br_shift, V, base_mva):
+    """
+    Compute the pi-model power flows of every branch in a single loop.
+
+    Parameters
+    ----------
+    br_i, br_j, br_r, br_x, br_b, br_tap, br_shift : numpy.ndarray
+        Branch arrays of the network (see ``Network``); a zero tap is treated as 1.
+    V : numpy.ndarray
+        Complex bus voltage phasors (p.u.).
+    base_mva : float
+        System base power, used to convert the flows to MW/MVAr.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        ``(P_ij, Q_ij, P_ji, Q_ji, losses)`` of every branch.
+    """
+    nbr = br_i.shape[0]
+    P_ij = np.empty(nbr)
+    Q_ij = np.empty(nbr)
+    P_ji = np.empty(nbr)
+    Q_ji = np.empty(nbr)
+    losses = np.empty(nbr)
+
+    for k in range(nbr):
+        y_series = 1.0 / complex(br_r[k], br_x[k])
+        y_shunt = complex(0.0, 0.5 * br_b[k])
+        tap = br_tap[k] if br_tap[k] != 0.0 else 1.0
+        tap_c = complex(tap * math.cos(br_shift[k]), tap * math.sin(br_shift[k]))
+
+        Vi = V[br_i[k]]
+        Vj = V[br_j[k]]
+        Vi_t = Vi / tap_c
+
+        Sij = Vi * ((Vi_t - Vj) * y_series + Vi_t * y_shunt).conjugate() * base_mva
+        Sji = Vj * ((Vj - Vi_t) * y_series + Vj * y_shunt).conjugate() * base_mva
+
+        P_ij[k] = Sij.real
+        Q_ij[k] = Sij.imag
+        P_ji[k] = Sji.real
+        Q_ji[k] = Sji.imag
+        losses[k] = Sij.real + Sji.real
+
+    return P_ij, Q_ij, P_ji, Q_ji, losses
+
+
+if njit is not None:
+    branch_flows = njit(cache=True, fastmath=True)(_branch_flows)
+else:
+    branch_flows = None
@@ -0,0 +1,106 @@
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional, build_jacobian falls back to NumPy
+    njit = None
+    prange = range
+
+
+def _jacobian_csc(indptr, indices, ydata, Vm, cosa, sina, P, Q, col_bus, theta_pos, V_pos, mP):
+    """
+    Assemble the polar power-flow Jacobian directly in CSC form.
+
+    Parameters
+    ----------
+    indptr, indices, ydata : numpy.ndarray
+        CSC structure and complex values of Ybus (row indices sorted).
+    Vm : numpy.ndarray
+        Bus voltage magnitudes.
+    cosa, sina : numpy.ndarray
+        ``cos`` and ``sin`` of the bus voltage angles.
+    P, Q : numpy.ndarray
+        Calculated bus injections.
+    col_bus : numpy.ndarray
+        Bus of every Jacobian column: ``p_rows`` (angle unknowns) followed by
+        ``q_rows`` (magnitude unknowns).
+    theta_pos, V_pos : numpy.ndarray
+        Position of every bus in ``p_rows`` / ``q_rows``, ``-1`` if absent.
+    mP : int
+        Number of active power equations.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        ``(data, indices, indptr)`` of the CSC Jacobian.
+    """
+    ncol = col_bus.shape[0]
+
+    # pass 1: entries per column (column m of J follows column m of Ybus)
+    counts = np.zeros(ncol + 1, dtype=np.int64)
+    for c in prange(ncol):
+        m = col_bus[c]
+        cnt = 0
+        for e in range(indptr[m], indptr[m + 1]):
+            k = indices[e]
+            if theta_pos[k] >= 0:
+                cnt += 1
+            if V_pos[k] >= 0:
+                cnt += 1
+        counts[c + 1] = cnt
+    jptr = np.cumsum(counts).astype(np.int32)
+
+    nnz = jptr[ncol]
+    jind = np.empty(nnz, dtype=np.int32)
+    jdat = np.empty(nnz, dtype=np.float64)
+
+    # pass 2: values, P rows first then Q rows, so row indices stay sorted
+    for c in prange(ncol):
+        m = col_bus[c]
+        is_theta = c < mP
+        Vmm = Vm[m]
+        p = jptr[c]
+        for rows_q in range(2):
+            for e in range(indptr[m], indptr[m + 1]):
+                k = indices[e]
+                row = V_pos[k] if rows_q else theta_pos[k]
+                if row < 0:
+                    continue
+                g = ydata[e].real
+                b = ydata[e].imag
+                # cos/sin of theta_k - theta_m from the per-bus values
+                ckm = cosa[k] * cosa[m] + sina[k] * sina[m]
+                skm = sina[k] * cosa[m] - cosa[k] * sina[m]
+                GsBc = g * skm - b * ckm
+                GcBs = g * ckm + b * skm
+                Vk = Vm[k]
+                Vsafe = max(Vk, 1e-12)
+                if is_theta:
+                    if rows_q:
+                        v = -Vk * Vmm * GcBs          # M
+                        if k == m:
+                            v += P[k]
+                    else:
+                        v = Vk * Vmm * GsBc           # H
+                        if k == m:
+                            v -= Q[k]
+                else:
+                    if rows_q:
+                        v = Vk * GsBc                 # L
+                        if k == m:
+                            v += Q[k] / Vsafe
+                    else:
+                        v = Vk * GcBs                 # N
+                        if k == m:
+                            v += P[k] / Vsafe
+                jind[p] = row + mP if rows_q else row
+                jdat[p] = v
+                p += 1
+
+    return jdat, jind, jptr
+
+
+if njit is not None:
+    jacobian_csc = njit(parallel=True, fastmath=True, cache=True)(_jacobian_csc)
+else:
+    jacobian_csc = None
@@ -0,0 +1,41 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled Ybus refresh kernel.
+
+Build in place with ``cythonize -i powerflow/math/_ybus_c.pyx``; when the
+extension is not built, ``build_ybus`` uses the numba or NumPy path instead.
+"""
+
+
+def fill_ybus_data(
+    const double complex[::1] yii,
+    const double complex[::1] yjj,
+    const double complex[::1] yij,
+    const double complex[::1] yji,
+    const double[::1] sh_g,
+    const double[::1] sh_b,
+    const int[::1] slot,
+    double complex[::1] data,
+):
+    """
+    Accumulate branch and shunt admittances into a CSC Ybus ``data`` array.
+
+    Same contract as ``powerflow.math._ybus_kernel._fill_ybus_data``: ``slot``
+    holds the data position of every ``[ii, jj, ij, ji]`` branch term followed
+    by the shunt terms, ``data`` is zero-initialized and updated in place.
+    """
+    cdef Py_ssize_t k
+    cdef Py_ssize_t nbr = yii.shape[0]
+    cdef Py_ssize_t off = 4 * nbr
+    cdef double complex ysh
+
+    for k in range(nbr):
+        data[slot[k]] += yii[k]
+        data[slot[nbr + k]] += yjj[k]
+        data[slot[2 * nbr + k]] += yij[k]
+        data[slot[3 * nbr + k]] += yji[k]
+
+    for k in range(sh_g.shape[0]):
+        ysh.real = sh_g[k]
+        ysh.imag = sh_b[k]
+        data[slot[off + k]] += ysh
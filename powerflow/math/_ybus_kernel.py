@@ -0,0 +1,46 @@
+try:
+    from powerflow.math._ybus_c import fill_ybus_data as _compiled_fill_ybus_data
+except ImportError:  # Cython extension not built
+    _compiled_fill_ybus_data = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional, build_ybus falls back to NumPy
+    njit = None
+
+
+def _fill_ybus_data(yii, yjj, yij, yji, sh_g, sh_b, slot, data):
+    """
+    Accumulate branch and shunt admittances into a CSC Ybus ``data`` array.
+
+    Parameters
+    ----------
+    yii, yjj, yij, yji : numpy.ndarray
+        Pi-model stamps of every branch (see ``Network.refresh_branch_constants``).
+    sh_g, sh_b : numpy.ndarray
+        Shunt conductance and susceptance (see ``Network.sh_*``).
+    slot : numpy.ndarray
+        Data slot of every contribution (``YbusCache.contrib_slot``), ordered as
+        ``[ii, jj, ij, ji]`` branch terms followed by the shunt terms.
+    data : numpy.ndarray
+        Complex CSC data array, zero-initialized, updated in place.
+    """
+    nbr = yii.shape[0]
+    for k in range(nbr):
+        data[slot[k]] += yii[k]
+        data[slot[nbr + k]] += yjj[k]
+        data[slot[2 * nbr + k]] += yij[k]
+        data[slot[3 * nbr + k]] += yji[k]
+
+    off = 4 * nbr
+    for k in range(sh_g.shape[0]):
+        data[slot[off + k]] += complex(sh_g[k], sh_b[k])
+
+
+# preference order: Cython extension, numba, none (NumPy path in build_ybus)
+if _compiled_fill_ybus_data is not None:
+    fill_ybus_data = _compiled_fill_ybus_data
+elif njit is not None:
+    fill_ybus_data = njit(cache=True, fastmath=True)(_fill_ybus_data)
+else:
+    fill_ybus_data = None
@@ -0,0 +1,177 @@
+
+from __future__ import annotations
+
+import numpy as np
+import scipy.sparse as sp
+from powerflow.math._jacobian_kernel import jacobian_csc
+
+
+def _positions(n: int, idx) -> np.ndarray:
+    """Position of every bus in ``idx`` (``-1`` for buses not in ``idx``)."""
+    pos = np.full(n, -1, dtype=np.intp)
+    pos[idx] = np.arange(len(idx))
+    return pos
+
+
+def build_jacobian(
+    Y: sp.spmatrix,
+    Vm: np.ndarray,
+    Va: np.ndarray,
+    P: np.ndarray,
+    Q: np.ndarray,
+    p_rows,
+    q_rows,
+    cos_Va: np.ndarray | None = None,
+    sin_Va: np.ndarray | None = None,
+) -> sp.csc_matrix:
+    """Build the sparse polar power-flow Jacobian ``[[H, N], [M, L]]``.
+
+    Parameters
+    ----------
+    Y : scipy.sparse matrix
+        Complex bus admittance matrix (see ``build_ybus``).
+    Vm, Va : numpy.ndarray
+        Bus voltage magnitudes (p.u.) and angles (radians).
+    P, Q : numpy.ndarray
+        Calculated active and reactive power injections (p.u.).
+    p_rows : array_like of int
+        Buses with an active power equation; also the voltage-angle unknowns.
+    q_rows : array_like of int
+        Buses with a reactive power equation; also the voltage-magnitude
+        unknowns.
+    cos_Va, sin_Va : numpy.ndarray, optional
+        ``cos(Va)`` and ``sin(Va)`` if already available to the caller (e.g. from
+        building the voltage phasors); computed otherwise.
+
+    Returns
+    -------
+    scipy.sparse.csc_matrix
+        Square Jacobian of size ``len(p_rows) + len(q_rows)``. Rows follow the
+        mismatch order ``[dP[p_rows], dQ[q_rows]]``, columns the unknowns
+        ``[Va[p_rows], Vm[q_rows]]``.
+
+    Notes
+    -----
+    The blocks share the sparsity of ``Y``. For every stored entry ``(k, m)``:
+
+    * ``H = Vk Vm (G sin - B cos)``, ``N = Vk (G cos + B sin)``
+    * ``M = -Vk Vm (G cos + B sin)``, ``L = Vk (G sin - B cos)``
+
+    evaluated at ``theta_k - theta_m``. On the diagonal these give
+    ``-Vk^2 Bkk``, ``Vk Gkk``, ``-Vk^2 Gkk`` and ``-Vk Bkk``; the analytic
+    diagonal is obtained by adding ``-Qk``, ``Pk/Vk``, ``Pk`` and ``Qk/Vk``
+    as extra entries, summed by the conversion to CSC. The entries are
+    evaluated with the complex formulation of MATPOWER's ``dSbus_dV``
+    (``H + jM = dS/dVa``, ``N + jL = dS/dVm``) restricted to the pattern of
+    ``Y``, so no trigonometry is needed beyond the phasors.
+
+    When numba is installed, the matrix is instead assembled column by column
+    in CSC form by a compiled parallel kernel, following the columns of ``Y``
+    and expanding the cosine and sine of the angle differences from the
+    per-bus ``cos``/``sin`` values; the diagonal terms then require ``Y`` to
+    store every diagonal entry, which ``build_ybus`` does for all buses with a
+    branch or shunt.
+    """
+    n = len(Vm)
+    if cos_Va is None:
+        cos_Va, sin_Va = np.cos(Va), np.sin(Va)
+
+    if jacobian_csc is not None:
+        Y = Y.tocsc()
+        theta_pos = _positions(n, p_rows)
+        V_pos = _positions(n, q_rows)
+        col_bus = np.concatenate([p_rows, q_rows]).astype(np.intp)
+        data, indices, indptr = jacobian_csc(
+            Y.indptr, Y.indices, Y.data, Vm, cos_Va, sin_Va, P, Q,
+            col_bus, theta_pos, V_pos, len(p_rows),
+        )
+        size = len(col_bus)
+        return sp.csc_matrix((data, indices, indptr), shape=(size, size))
+
+    # complex derivatives of the bus injections (MATPOWER dSbus_dV) on the
+    # stored entries of Y:
+    #   dS/dVa = j diag(V) conj(diag(I) - Y diag(V))
+    #   dS/dVm = diag(V) conj(Y diag(E)) + conj(diag(I)) diag(E),  E = V/|V|
+    # with the diagonal terms j V conj(I) = jS and conj(I) E = S/|V|
+    Yc = Y.tocoo()
+    diag = np.arange(n)
+    k = np.concatenate([Yc.row, diag])
+    m = np.concatenate([Yc.col, diag])
+
+    E = cos_Va + 1j * sin_Va
+    V = Vm * E
+    Vk = V[Yc.row]
+    S = P + 1j * Q
+    dS_dVa = np.concatenate([-1j * Vk * np.conj(Yc.data * V[Yc.col]), 1j * S])
+    dS_dVm = np.concatenate([Vk * np.conj(Yc.data * E[Yc.col]), S / np.maximum(Vm, 1e-12)])
+    H, M = dS_dVa.real, dS_dVa.imag
+    N, L = dS_dVm.real, dS_dVm.imag
+
+    mP, mQ = len(p_rows), len(q_rows)
+    theta_pos = _positions(n, p_rows)
+    V_pos = _positions(n, q_rows)
+    rP, rQ = theta_pos[k], V_pos[k]
+    cT, cV = theta_pos[m], V_pos[m]
+
+    rows, cols, data = [], [], []
+    for r, c_, d, row_off, col_off in (
+        (rP, cT, H, 0, 0),
+        (rP, cV, N, 0, mP),
+        (rQ, cT, M, mP, 0),
+        (rQ, cV, L, mP, mP),
+    ):
+        keep = (r >= 0) & (c_ >= 0)
+        rows.append(r[keep] + row_off)
+        cols.append(c_[keep] + col_off)
+        data.append(d[keep])
+
+    size = mP + mQ
+    return sp.coo_matrix(
+        (np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))), shape=(size, size)
+    ).tocsc()
+
+
+def build_jacobian_dense(
+    Y: sp.spmatrix,
+    Vm: np.ndarray,
+    Va: np.ndarray,
+    P: np.ndarray,
+    Q: np.ndarray,
+    p_rows,
+    q_rows,
+    cos_Va: np.ndarray | None = None,
+    sin_Va: np.ndarray | None = None,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Build the polar power-flow Jacobian ``[[H, N], [M, L]]`` as a dense array.
+
+    Parameters
+    ----------
+    Y, Vm, Va, P, Q, p_rows, q_rows, cos_Va, sin_Va
+        As in ``build_jacobian``.
+    out : numpy.ndarray, optional
+        C-contiguous float64 array of shape ``(len(p_rows) + len(q_rows),) * 2``
+        the Jacobian is written into, so that a solver can reuse one buffer
+        across iterations. Every element is overwritten. A new array is
+        allocated if omitted.
+
+    Returns
+    -------
+    numpy.ndarray
+        Dense Jacobian with the same row/column ordering as ``build_jacobian``
+        (``out`` itself when given).
+
+    Notes
+    -----
+    Intended for small networks, where dense linear algebra beats the sparse
+    overhead. The entries are computed on the sparsity pattern of ``Y`` by
+    ``build_jacobian`` and scattered into the zeroed output, so ``Y`` is never
+    densified and no ``n x n`` temporaries are created: the only dense array
+    is the Jacobian itself.
+    """
+    J = build_jacobian(Y, Vm, Va, P, Q, p_rows, q_rows, cos_Va, sin_Va)
+    if out is None:
+        return J.toarray()
+    out.fill(0.0)
+    J.toarray(out=out)  # sums into out
+    return out
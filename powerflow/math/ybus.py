@@ -1,20 +1,117 @@
 
 import numpy as np
+import scipy.sparse as sp
+from powerflow.math._ybus_kernel import fill_ybus_data
 from powerflow.network.network import Network
 
-def build_ybus(network: Network) -> np.ndarray:
+
+class YbusCache:
+    """
+    Sparsity pattern of the Ybus matrix of a network.
+
+    The pattern only depends on the network topology (branch end buses and
+    shunt buses), so it is computed once and reused by ``build_ybus`` to refresh
+    the numeric values without rebuilding the CSC structure.
+
+    Attributes
+    ----------
+    shape : tuple of int
+        Shape ``(nbus, nbus)`` of the matrix.
+    indptr : numpy.ndarray
+        CSC column pointer array (int32).
+    indices : numpy.ndarray
+        CSC row indices (int32, sorted within each column).
+    contrib_slot : numpy.ndarray
+        For every branch/shunt contribution, in the order produced by
+        ``build_ybus``, the position in the CSC ``data`` array it is added to.
+    """
+
+    def __init__(self, network: Network):
+        """
+        Compute the Ybus sparsity pattern of ``network``.
+
+        Parameters
+        ----------
+        network : Network
+            The power system network whose topology defines the pattern.
+        """
+        n = network.nbus
+        i, j, k = network._yb_i, network._yb_j, network.sh_k
+        rows = np.concatenate([i, j, i, j, k])
+        cols = np.concatenate([i, j, j, i, k])
+
+        pattern = sp.coo_matrix((np.ones(len(rows)), (rows, cols)), shape=(n, n)).tocsc()
+        pattern.sum_duplicates()
+
+        # int32 indices (scipy defaults to intp) halve the index traffic of the
+        # sparse kernels and are what KLU/SuperLU use natively
+        self.shape = (n, n)
+        self.indptr = pattern.indptr.astype(np.int32)
+        self.indices = pattern.indices.astype(np.int32)
+
+        # CSC entries are ordered by (column, row): a flat key keeps that order, so
+        # each contribution finds its slot with a binary search
+        entry_cols = np.repeat(np.arange(n, dtype=np.int64), np.diff(self.indptr))
+        keys = entry_cols * n + self.indices
+        self.contrib_slot = np.searchsorted(keys, cols * n + rows).astype(np.int32)
+
+    def scatter(self, values: np.ndarray) -> np.ndarray:
+        """
+        Sum per-contribution values into a CSC data array.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            Complex contributions, aligned with ``contrib_slot``.
+
+        Returns
+        -------
+        numpy.ndarray
+            CSC data array matching ``indices``.
+        """
+        # bincount is a single C loop, much faster than the unbuffered np.add.at
+        nnz = len(self.indices)
+        data = np.empty(nnz, dtype=complex)
+        data.real = np.bincount(self.contrib_slot, weights=values.real, minlength=nnz)
+        data.imag = np.bincount(self.contrib_slot, weights=values.imag, minlength=nnz)
+        return data
+
+    def matrix(self, data: np.ndarray) -> sp.csc_matrix:
+        """
+        Wrap a CSC data array with this pattern into a sparse matrix.
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+            Complex CSC data array matching ``indices``.
+
+        Returns
+        -------
+        scipy.sparse.csc_matrix
+            The assembled matrix.
+        """
+        return sp.csc_matrix((data, self.indices, self.indptr), shape=self.shape)
+
+
+def build_ybus(network: Network, refresh_only: bool = False) -> sp.csc_matrix:
     """Build the bus admittance matrix (Ybus) for the given network.
 
     Parameters
     ----------
     network : Network
         The power system network containing buses, branches, and shunt elements.
+    refresh_only : bool, optional
+        If ``True`` and a sparsity pattern was cached on the network by a previous
+        call, reuse it and only recompute the numeric values. Use it for repeated
+        builds where branch/shunt parameters change but the topology does not.
+        The pattern is rebuilt anyway if the number of stamps changed.
+        Defaults to ``False``.
 
     Returns
     -------
-    numpy.ndarray
+    scipy.sparse.csc_matrix
         The complex bus admittance matrix (Ybus) of shape (nbus, nbus), where
-        ``nbus`` is the number of buses in the network.
+        ``nbus`` is the number of buses in the network, in sparse CSC format.
 
     Notes
     -----
@@ -28,23 +125,31 @@ def build_ybus(network: Network) -> np.ndarray:
       negative of the branch admittance scaled by the transformer ratio.
     * Diagonal elements accumulate the self-admittance including shunt charging
       and shunt elements connected to each bus.
-    """
-    n = network.nbus
-    Y = np.zeros((n, n), dtype=complex)
 
-    for br in network.branches:
-        z = complex(br.r, br.x)
-        y = 1 / z
-        ysh = 1j * br.b / 2.0
-        t = br.tap * np.exp(1j * np.deg2rad(br.shift_deg))
-        i, j = br.i, br.j
-
-        Y[i, i] += (y + ysh) / (abs(t) ** 2)
-        Y[j, j] += (y + ysh)
-        Y[i, j] += -y / np.conj(t)
-        Y[j, i] += -y / t
+    The branch stamps are precomputed by ``Network.refresh_branch_constants``,
+    so the assembly only scatters them, together with the shunt admittances,
+    into the data array of a ``YbusCache`` pattern, where duplicate entries
+    (diagonals, parallel branches, multiple shunts on the same bus) are summed.
+    The pattern is stored in ``network._ybus_pattern``. When the Cython
+    extension ``_ybus_c`` is built, or numba is installed, the scatter is done by
+    a compiled kernel.
+    """
+    pattern = network._ybus_pattern
+    n_contrib = 4 * len(network._yii) + len(network.sh_k)
+    if not refresh_only or pattern is None or len(pattern.contrib_slot) != n_contrib:
+        pattern = YbusCache(network)
+        network._ybus_pattern = pattern
 
-    for sh in network.shunts:
-        Y[sh.k, sh.k] += complex(sh.g, sh.b)
+    if fill_ybus_data is not None:
+        data = np.zeros(len(pattern.indices), dtype=complex)
+        fill_ybus_data(
+            network._yii, network._yjj, network._yij, network._yji,
+            network.sh_g, network.sh_b, pattern.contrib_slot, data,
+        )
+        return pattern.matrix(data)
 
-    return Y
+    values = np.concatenate([
+        network._yii, network._yjj, network._yij, network._yji,
+        network.sh_g + 1j * network.sh_b,
+    ])
+    return pattern.matrix(pattern.scatter(values))
@@ -4,6 +4,90 @@ from powerflow.elements.bus import BusType, Bus
 from powerflow.elements.branch import Branch
 from powerflow.elements.shunt import Shunt
 
+
+def _array_field(name, cast=float, refresh=False):
+    """Element attribute backed by entry ``_k`` of the network array ``name``."""
+    def fget(self):
+        return cast(getattr(self._net, name)[self._k])
+
+    def fset(self, value):
+        getattr(self._net, name)[self._k] = value
+        if refresh:
+            self._net.refresh_branch_constants()
+
+    return property(fget, fset)
+
+
+def _limit_field(name, unset):
+    """Reactive limit backed by a network array, ``None`` stored as ``unset``."""
+    def fget(self):
+        value = float(getattr(self._net, name)[self._k])
+        return None if value == unset else value
+
+    def fset(self, value):
+        getattr(self._net, name)[self._k] = unset if value is None else value
+
+    return property(fget, fset)
+
+
+class _BusView(Bus):
+    """``Bus`` reading and writing the ``bus_*`` arrays of a network."""
+
+    __slots__ = ('_net', '_k')
+
+    def __init__(self, net, k):
+        self._net, self._k = net, k
+
+    idx = _array_field('bus_idx', int)
+    V = _array_field('bus_V')
+    theta = _array_field('bus_theta')
+    P = _array_field('bus_P')
+    Q = _array_field('bus_Q')
+    Qmin = _limit_field('bus_Qmin', -np.inf)
+    Qmax = _limit_field('bus_Qmax', np.inf)
+
+    @property
+    def type(self) -> str:
+        return BusType.NAMES[self._net.bus_type_code[self._k]]
+
+    @type.setter
+    def type(self, value: str):
+        if value not in BusType.CODE:
+            raise ValueError(f"Invalid bus type: {value!r}")
+        self._net.bus_type_code[self._k] = BusType.CODE[value]
+        self._net._set_bus_types()
+
+
+class _BranchView(Branch):
+    """``Branch`` reading and writing the ``br_*`` arrays of a network."""
+
+    __slots__ = ('_net', '_k')
+
+    def __init__(self, net, k):
+        self._net, self._k = net, k
+
+    i = _array_field('br_i', int, refresh=True)
+    j = _array_field('br_j', int, refresh=True)
+    r = _array_field('br_r', refresh=True)
+    x = _array_field('br_x', refresh=True)
+    b = _array_field('br_b', refresh=True)
+    tap = _array_field('br_tap', refresh=True)
+    shift = _array_field('br_shift', refresh=True)
+
+
+class _ShuntView(Shunt):
+    """``Shunt`` reading and writing the ``sh_*`` arrays of a network."""
+
+    __slots__ = ('_net', '_k')
+
+    def __init__(self, net, k):
+        self._net, self._k = net, k
+
+    k = _array_field('sh_k', int, refresh=True)
+    g = _array_field('sh_g', refresh=True)
+    b = _array_field('sh_b', refresh=True)
+
+
 class Network:
     """
     Represents a power system network for load flow analysis.
@@ -15,16 +99,49 @@ class Network:
     Attributes
     ----------
     buses : list of Bus
-        List of bus objects in the network.
+        Bus objects of the network, backed by the ``bus_*`` arrays.
     branches : list of Branch
-        List of branch (transmission line/transformer) objects.
-    shunts : list of Shunt, optional
-        List of shunt admittance elements. Defaults to empty list.
+        Branch (transmission line/transformer) objects, backed by the ``br_*``
+        arrays.
+    shunts : list of Shunt
+        Shunt admittance elements, backed by the ``sh_*`` arrays.
     base_mva : float, optional
         System base MVA for per-unit calculations. Defaults to 100.0 MVA.
+    bus_idx : numpy.ndarray
+        0-based index of every bus (int32), ordered by position in ``buses``.
+    bus_type_code : numpy.ndarray
+        Bus type of every bus as an int8 code (see ``BusType.CODE``).
+    bus_V, bus_theta : numpy.ndarray
+        Initial/specified voltage magnitude (p.u.) and angle (radians) of every
+        bus.
+    bus_P, bus_Q : numpy.ndarray
+        Net injected active and reactive power of every bus (p.u.).
+    bus_Qmin, bus_Qmax : numpy.ndarray
+        Reactive power limits of every bus (p.u.), ``-inf``/``+inf`` when unset.
+    br_i, br_j : numpy.ndarray
+        From/to bus indices of every branch (int).
+    br_r, br_x, br_b : numpy.ndarray
+        Series resistance, series reactance and total charging susceptance of
+        every branch (p.u.).
+    br_tap, br_shift : numpy.ndarray
+        Transformer tap ratio and phase shift (radians) of every branch.
+    br_tcplx, br_inv_t, br_inv_conj_t, br_inv_t2 : numpy.ndarray
+        Complex transformer ratio ``t`` of every branch, ``1/t``, ``1/conj(t)``
+        and ``1/|t|^2`` (see ``refresh_branch_constants``).
+    sh_k : numpy.ndarray
+        Bus index of every shunt element (int).
+    sh_g, sh_b : numpy.ndarray
+        Conductance and susceptance of every shunt element (p.u.).
     """
     
-    def __init__(self, buses: list[Bus], branches: list[Branch], shunts: list[Shunt]=None, base_mva: float=100.0):
+    def __init__(
+        self,
+        buses: list[Bus],
+        branches: list[Branch],
+        shunts: list[Shunt]=None,
+        base_mva: float=100.0,
+        merge_parallel: bool=False,
+    ):
         """
         Initialize a Network object.
         
@@ -41,6 +158,11 @@ class Network:
             If None, defaults to an empty list.
         base_mva : float, optional
             System base MVA used for per-unit calculations. Defaults to 100.0 MVA.
+        merge_parallel : bool, optional
+            If ``True``, branches connecting the same pair of buses are merged
+            into a single set of Ybus stamps. This only affects Ybus assembly;
+            the per-branch ``br_*`` arrays (used for branch flows) are kept.
+            Defaults to ``False``.
         
         Examples
         --------
@@ -49,11 +171,325 @@ class Network:
         >>> buses = [Bus(0, BusType.SLACK), Bus(1, BusType.PQ)]
         >>> branches = [Branch(0, 1, r=0.01, x=0.05)]
         >>> net = Network(buses, branches, base_mva=100.0)
+
+        Notes
+        -----
+        Bus, branch and shunt parameters are also copied once into contiguous
+        NumPy arrays (``bus_*``, ``br_*`` and ``sh_*`` attributes) so that the
+        numerical kernels (``build_ybus``, the load-flow solver) can work on whole
+        vectors instead of iterating over Python objects. The arrays are what the
+        solvers read: changes made to the objects passed in are not picked up
+        after construction. Edit the network through ``buses``/``branches``/
+        ``shunts`` instead, whose objects write through to the arrays, or use
+        ``Network.from_arrays`` to skip the element objects altogether.
+        """
+        shunts = shunts if shunts is not None else []
+        nb, nbr, nsh = len(buses), len(branches), len(shunts)
+        self._set_arrays(
+            bus_idx=np.fromiter((bus.idx for bus in buses), np.int32, count=nb),
+            bus_type_code=np.fromiter((BusType.CODE[bus.type] for bus in buses), np.int8, count=nb),
+            bus_V=np.fromiter((bus.V for bus in buses), float, count=nb),
+            bus_theta=np.fromiter((bus.theta for bus in buses), float, count=nb),
+            bus_P=np.fromiter((bus.P for bus in buses), float, count=nb),
+            bus_Q=np.fromiter((bus.Q for bus in buses), float, count=nb),
+            bus_Qmin=np.fromiter((-np.inf if bus.Qmin is None else bus.Qmin for bus in buses), float, count=nb),
+            bus_Qmax=np.fromiter((np.inf if bus.Qmax is None else bus.Qmax for bus in buses), float, count=nb),
+            br_i=np.fromiter((br.i for br in branches), int, count=nbr),
+            br_j=np.fromiter((br.j for br in branches), int, count=nbr),
+            br_r=np.fromiter((br.r for br in branches), float, count=nbr),
+            br_x=np.fromiter((br.x for br in branches), float, count=nbr),
+            br_b=np.fromiter((br.b for br in branches), float, count=nbr),
+            br_tap=np.fromiter((br.tap for br in branches), float, count=nbr),
+            br_shift=np.fromiter((br.shift for br in branches), float, count=nbr),
+            sh_k=np.fromiter((sh.k for sh in shunts), int, count=nsh),
+            sh_g=np.fromiter((sh.g for sh in shunts), float, count=nsh),
+            sh_b=np.fromiter((sh.b for sh in shunts), float, count=nsh),
+            base_mva=base_mva,
+            merge_parallel=merge_parallel,
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        bus_type_code,
+        bus_V,
+        bus_theta_deg,
+        bus_P,
+        bus_Q,
+        br_i,
+        br_j,
+        br_r,
+        br_x,
+        br_b=None,
+        br_tap=None,
+        br_shift_deg=None,
+        bus_Qmin=None,
+        bus_Qmax=None,
+        sh_k=None,
+        sh_g=None,
+        sh_b=None,
+        bus_idx=None,
+        base_mva: float = 100.0,
+        merge_parallel: bool = False,
+    ) -> "Network":
+        """
+        Build a Network directly from per-element arrays.
+
+        This is the fast path used by the loaders: no ``Bus``/``Branch``/``Shunt``
+        objects are created up front, they are materialized only when the
+        ``buses``/``branches``/``shunts`` attributes are accessed.
+
+        Parameters
+        ----------
+        bus_type_code : array_like of int
+            Bus type code of every bus (see ``BusType.CODE``).
+        bus_V, bus_theta_deg : array_like
+            Voltage magnitude (p.u.) and angle (degrees) of every bus.
+        bus_P, bus_Q : array_like
+            Net injected active and reactive power of every bus (p.u.).
+        br_i, br_j : array_like
+            From/to bus indices (0-based) of every branch.
+        br_r, br_x : array_like
+            Series resistance and reactance of every branch (p.u.).
+        br_b, br_tap, br_shift_deg : array_like, optional
+            Charging susceptance (p.u.), tap ratio and phase shift (degrees) of
+            every branch. Default to 0, 1 and 0.
+        bus_Qmin, bus_Qmax : array_like, optional
+            Reactive limits of every bus (p.u.); ``-inf``/``+inf`` mean no limit.
+            Default to no limits.
+        sh_k, sh_g, sh_b : array_like, optional
+            Bus index, conductance and susceptance of every shunt. Default to no
+            shunts.
+        bus_idx : array_like, optional
+            0-based index of every bus. Defaults to ``0..nbus-1``.
+        base_mva : float, optional
+            System base MVA used for per-unit calculations. Defaults to 100.0 MVA.
+        merge_parallel : bool, optional
+            If ``True``, branches connecting the same pair of buses are merged
+            into a single set of Ybus stamps. This only affects Ybus assembly;
+            the per-branch ``br_*`` arrays (used for branch flows) are kept.
+            Defaults to ``False``.
+
+        Returns
+        -------
+        Network
+            The network.
         """
-        self.buses = buses
-        self.branches = branches
-        self.shunts = shunts if shunts is not None else []
+        nb, nbr = len(bus_V), len(br_i)
+        net = cls.__new__(cls)
+        net._set_arrays(
+            bus_idx=np.arange(nb, dtype=np.int32) if bus_idx is None else np.ascontiguousarray(bus_idx, np.int32),
+            bus_type_code=np.ascontiguousarray(bus_type_code, np.int8),
+            bus_V=np.ascontiguousarray(bus_V, float),
+            bus_theta=np.deg2rad(np.ascontiguousarray(bus_theta_deg, float)),
+            bus_P=np.ascontiguousarray(bus_P, float),
+            bus_Q=np.ascontiguousarray(bus_Q, float),
+            bus_Qmin=np.full(nb, -np.inf) if bus_Qmin is None else np.ascontiguousarray(bus_Qmin, float),
+            bus_Qmax=np.full(nb, np.inf) if bus_Qmax is None else np.ascontiguousarray(bus_Qmax, float),
+            br_i=np.ascontiguousarray(br_i, int),
+            br_j=np.ascontiguousarray(br_j, int),
+            br_r=np.ascontiguousarray(br_r, float),
+            br_x=np.ascontiguousarray(br_x, float),
+            br_b=np.zeros(nbr) if br_b is None else np.ascontiguousarray(br_b, float),
+            br_tap=np.ones(nbr) if br_tap is None else np.ascontiguousarray(br_tap, float),
+            br_shift=np.zeros(nbr) if br_shift_deg is None else np.deg2rad(np.ascontiguousarray(br_shift_deg, float)),
+            sh_k=np.zeros(0, int) if sh_k is None else np.ascontiguousarray(sh_k, int),
+            sh_g=np.zeros(0) if sh_g is None else np.ascontiguousarray(sh_g, float),
+            sh_b=np.zeros(0) if sh_b is None else np.ascontiguousarray(sh_b, float),
+            base_mva=base_mva,
+            merge_parallel=merge_parallel,
+        )
+        return net
+
+    def _set_arrays(
+        self, bus_idx, bus_type_code, bus_V, bus_theta, bus_P, bus_Q, bus_Qmin, bus_Qmax,
+        br_i, br_j, br_r, br_x, br_b, br_tap, br_shift, sh_k, sh_g, sh_b, base_mva,
+        merge_parallel,
+    ):
+        """Store the element arrays and the quantities derived from them."""
         self.base_mva = base_mva
+        self.merge_parallel = merge_parallel
+
+        self.bus_idx = bus_idx
+        self.bus_type_code = bus_type_code
+        self.bus_V = bus_V
+        self.bus_theta = bus_theta
+        self.bus_P = bus_P
+        self.bus_Q = bus_Q
+        self.bus_Qmin = bus_Qmin
+        self.bus_Qmax = bus_Qmax
+
+        self.br_i = br_i
+        self.br_j = br_j
+        self.br_r = br_r
+        self.br_x = br_x
+        self.br_b = br_b
+        self.br_tap = br_tap
+        self.br_shift = br_shift
+
+        self.sh_k = sh_k
+        self.sh_g = sh_g
+        self.sh_b = sh_b
+
+        self.refresh_branch_constants()
+        self._set_bus_types()
+
+        self._ybus_pattern = None  # YbusCache, filled by build_ybus
+        self._bus_arrays = None    # see bus_arrays
+        self._buses = self._branches = self._shunts = None  # element views
+
+    def _set_bus_types(self):
+        """Compute the bus-type index arrays shared by every solve."""
+        code = BusType.CODE
+        bus_idx, bus_type_code = self.bus_idx, self.bus_type_code
+        slack = bus_idx[bus_type_code == code[BusType.SLACK]]
+        self._slack = int(slack[0]) if len(slack) else None
+        self._pv = bus_idx[bus_type_code == code[BusType.PV]]
+        self._pq = bus_idx[bus_type_code == code[BusType.PQ]]
+        self._pvpq = bus_idx[bus_type_code != code[BusType.SLACK]]
+
+    def refresh_branch_constants(self):
+        """
+        Recompute the branch quantities derived from the ``br_*`` parameters.
+
+        The complex transformer ratio, its inverses and the four pi-model Ybus
+        stamps of every branch only depend on the branch parameters, so they are
+        computed once here and ``build_ybus`` just scatters them. Call this method
+        after editing ``br_r``/``br_x``/``br_b``/``br_tap``/``br_shift`` in place,
+        before rebuilding Ybus; after editing ``br_i``/``br_j``/``sh_k`` or
+        ``merge_parallel`` too. It also drops the Ybus cached by the last solve
+        (``_ybus_cache``) and the Ybus sparsity pattern (``_ybus_pattern``).
+        """
+        c, s = np.cos(self.br_shift), np.sin(self.br_shift)
+        inv_tap = 1.0 / self.br_tap
+        self.br_tcplx = self.br_tap * (c + 1j * s)
+        self.br_inv_t = (c - 1j * s) * inv_tap
+        self.br_inv_conj_t = (c + 1j * s) * inv_tap
+        self.br_inv_t2 = inv_tap * inv_tap
+
+        # pi-model stamps Y[i,i], Y[j,j], Y[i,j], Y[j,i] of every branch; plain
+        # lines (t = 1) need no scaling, only the transformer subset is corrected
+        self._y = 1.0 / (self.br_r + 1j * self.br_x)
+        self._ysh = 0.5j * self.br_b
+        self._yjj = self._y + self._ysh
+        self._yii = self._yjj.copy()
+        self._yij = -self._y
+
+        xf = np.flatnonzero((self.br_tap != 1.0) | (self.br_shift != 0.0))
+        self._yii[xf] *= self.br_inv_t2[xf]
+        self._yij[xf] *= self.br_inv_conj_t[xf]
+
+        # without phase shifters t is real and Ybus is complex symmetric:
+        # Y[j,i] shares the Y[i,j] stamps instead of being computed again
+        self._symmetric = not np.any(self.br_shift)
+        if self._symmetric:
+            self._yji = self._yij
+        else:
+            self._yji = -self._y
+            self._yji[xf] *= self.br_inv_t[xf]
+
+        # end buses of the stamps (differ from br_i/br_j once parallels are merged)
+        self._yb_i, self._yb_j = self.br_i, self.br_j
+        if self.merge_parallel and len(self.br_i):
+            self._merge_parallel_stamps()
+
+        self._ybus_cache = None    # Ybus of the last solve, stale from now on
+        self._ybus_pattern = None  # the stamp end buses may have changed
+
+    def _merge_parallel_stamps(self):
+        """Sum the Ybus stamps of branches connecting the same pair of buses."""
+        n = self.nbus
+        # orient every branch from its lower to its higher bus index
+        fwd = self.br_i < self.br_j
+        lo = np.where(fwd, self.br_i, self.br_j)
+        hi = np.where(fwd, self.br_j, self.br_i)
+        keys, inverse = np.unique(lo.astype(np.int64) * n + hi, return_inverse=True)
+
+        def merged(v):
+            return (np.bincount(inverse, weights=v.real, minlength=len(keys))
+                    + 1j * np.bincount(inverse, weights=v.imag, minlength=len(keys)))
+
+        yii, yjj, yij, yji = self._yii, self._yjj, self._yij, self._yji
+        self._yii = merged(np.where(fwd, yii, yjj))
+        self._yjj = merged(np.where(fwd, yjj, yii))
+        self._yij = merged(np.where(fwd, yij, yji))
+        self._yji = self._yij if self._symmetric else merged(np.where(fwd, yji, yij))
+        self._yb_i = keys // n
+        self._yb_j = keys % n
+
+    @property
+    def buses(self) -> list[Bus]:
+        """
+        Get the bus objects of the network.
+
+        Returns
+        -------
+        list of Bus
+            One object per bus, created on first access. The objects read and
+            write the ``bus_*`` arrays, so ``net.buses[k].P = ...`` is seen by the
+            next solve.
+        """
+        if self._buses is None:
+            self._buses = [_BusView(self, k) for k in range(self.nbus)]
+        return self._buses
+
+    @property
+    def branches(self) -> list[Branch]:
+        """
+        Get the branch objects of the network.
+
+        Returns
+        -------
+        list of Branch
+            One object per branch, created on first access. The objects read and
+            write the ``br_*`` arrays; setting an attribute also calls
+            ``refresh_branch_constants``.
+        """
+        if self._branches is None:
+            self._branches = [_BranchView(self, k) for k in range(len(self.br_i))]
+        return self._branches
+
+    @property
+    def shunts(self) -> list[Shunt]:
+        """
+        Get the shunt objects of the network.
+
+        Returns
+        -------
+        list of Shunt
+            One object per shunt, created on first access. The objects read and
+            write the ``sh_*`` arrays; setting an attribute also calls
+            ``refresh_branch_constants``.
+        """
+        if self._shunts is None:
+            self._shunts = [_ShuntView(self, k) for k in range(len(self.sh_k))]
+        return self._shunts
+
+    @property
+    def bus_arrays(self) -> dict[str, np.ndarray]:
+        """
+        Get the bus data as a dictionary of NumPy arrays.
+
+        Returns
+        -------
+        dict of str to numpy.ndarray
+            ``Vm0``, ``Va0`` (radians), ``P``, ``Q``, ``Qmin``, ``Qmax`` (float64)
+            and ``type_code`` (int8, see ``BusType.CODE``), one entry per bus.
+            The arrays are the ``bus_*`` attributes themselves, not copies: do not
+            modify them in place unless the network data must change. The
+            dictionary is built once and cached.
+        """
+        if self._bus_arrays is None:
+            self._bus_arrays = {
+                "Vm0": self.bus_V,
+                "Va0": self.bus_theta,
+                "P": self.bus_P,
+                "Q": self.bus_Q,
+                "Qmin": self.bus_Qmin,
+                "Qmax": self.bus_Qmax,
+                "type_code": self.bus_type_code,
+            }
+        return self._bus_arrays
 
     @property
     def nbus(self):
@@ -65,7 +501,7 @@ class Network:
         int
             Total number of buses in the network.
         """
-        return len(self.buses)
+        return len(self.bus_V)
 
     def slack_index(self):
         """
@@ -78,14 +514,16 @@ class Network:
         
         Raises
         ------
-        StopIteration
+        ValueError
             If no slack bus is found in the network.
         
         Notes
         -----
         The network must have exactly one slack bus for load flow analysis.
         """
-        return next(b.idx for b in self.buses if b.type == BusType.SLACK)
+        if self._slack is None:
+            raise ValueError("No slack bus in the network")
+        return self._slack
 
     def pv_indices(self):
         """
@@ -93,15 +531,16 @@ class Network:
         
         Returns
         -------
-        list of int
-            List of 0-based indices for all PV buses in the network.
+        numpy.ndarray
+            0-based indices (int32) of all PV buses in the network, in bus
+            order. The array is cached: do not modify it in place.
         
         Notes
         -----
         PV buses have fixed voltage magnitude and active power injection,
         with reactive power determined by the load flow solution.
         """
-        return [b.idx for b in self.buses if b.type == BusType.PV]
+        return self._pv
 
     def pq_indices(self):
         """
@@ -109,12 +548,29 @@ class Network:
         
         Returns
         -------
-        list of int
-            List of 0-based indices for all PQ buses in the network.
+        numpy.ndarray
+            0-based indices (int32) of all PQ buses in the network, in bus
+            order. The array is cached: do not modify it in place.
         
         Notes
         -----
         PQ buses have fixed active and reactive power injections,
         with voltage magnitude and angle determined by the load flow solution.
         """
-        return [b.idx for b in self.buses if b.type == BusType.PQ]
+        return self._pq
+
+    def pvpq_indices(self):
+        """
+        Get the indices of all non-slack (PV and PQ) buses.
+
+        Returns
+        -------
+        numpy.ndarray
+            0-based indices (int32) of all PV and PQ buses, in bus order. The
+            array is cached: do not modify it in place.
+
+        Notes
+        -----
+        These are the buses whose voltage angle is an unknown of the load flow.
+        """
+        return self._pvpq
@@ -2,11 +2,19 @@
 from __future__ import annotations
 
 import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import solve as la_solve
+from scipy.sparse.linalg import splu
 from typing import TypedDict
-from powerflow.elements.bus import BusType
+from powerflow.math.jacobian import build_jacobian, build_jacobian_dense
 from powerflow.math.ybus import build_ybus
 from powerflow.network.network import Network
 
+try:
+    import cupy as cp
+except ImportError:  # cupy is optional, solve_batch falls back to NumPy
+    cp = None
+
 
 class LoadFlowResult(TypedDict):
     """Typed container for the Newton-Raphson load-flow solution results."""
@@ -19,6 +27,59 @@ class LoadFlowResult(TypedDict):
     converged: bool
 
 
+class _JacobianLU:
+    """
+    Sparse LU factorization of successive Jacobians sharing one sparsity pattern.
+
+    The first factorization lets SuperLU compute the fill-reducing column
+    ordering. Later ones apply that ordering symmetrically to the matrix up
+    front, through a cached gather of the CSC data, and factor with the natural
+    ordering, so the ordering step is done once. Use a new instance whenever the
+    pattern changes (PV to PQ conversions).
+
+    The Jacobian is always structurally symmetric, since Ybus stores both
+    ``(i, j)`` and ``(j, i)`` of every branch and the rows and columns follow
+    the same buses, also with phase shifters. The ordering is therefore
+    computed on ``A^T + A`` and diagonal pivots are preferred.
+    """
+
+    options = dict(SymmetricMode=True)
+    permc_spec = "MMD_AT_PLUS_A"
+
+    def __init__(self) -> None:
+        self.order = None
+        self.lu = None
+        self._permuted = False
+
+    def factor(self, J: sp.csc_matrix) -> None:
+        """Factor ``J``, reusing the ordering computed on the first call."""
+        if self.order is not None and J.nnz == len(self._src):
+            Jp = sp.csc_matrix((J.data[self._src], self._indices, self._indptr), shape=J.shape)
+            self.lu = splu(Jp, permc_spec="NATURAL", options=self.options)
+            self._permuted = True
+            return
+
+        lu = splu(J, permc_spec=self.permc_spec, options=self.options)
+        self.order = np.argsort(lu.perm_c)
+        # permute a matrix holding the data positions to get the gather map
+        marker = sp.csc_matrix((np.arange(1.0, J.nnz + 1), J.indices, J.indptr), shape=J.shape)
+        Jp = marker[self.order][:, self.order].tocsc()
+        Jp.sort_indices()  # splu would sort them in place, breaking the map
+        self._src = Jp.data.astype(np.intp) - 1
+        self._indices, self._indptr = Jp.indices, Jp.indptr
+        # this one factors J itself: its solve needs no permutation
+        self.lu = lu
+        self._permuted = False
+
+    def solve(self, b: np.ndarray) -> np.ndarray:
+        """Solve ``J x = b`` with the last factorization."""
+        if not self._permuted:
+            return self.lu.solve(b)
+        x = np.empty_like(b)
+        x[self.order] = self.lu.solve(b[self.order])
+        return x
+
+
 class LoadFlow:
     """
     Newton-Raphson load-flow solver.
@@ -31,13 +92,55 @@ class LoadFlow:
         Maximum number of Newton iterations. Defaults to ``100``.
     verbose : bool, optional
         If ``True``, prints per-iteration convergence information. Defaults to ``False``.
+    sparse : bool, optional
+        If ``True``, the Jacobian is assembled as a sparse matrix and factored with
+        SuperLU. If ``False``, it is assembled and solved densely, which is only
+        worthwhile for very small networks. Defaults to ``True``.
+    algorithm : {"nr", "fdpf"}, optional
+        ``"nr"`` runs the full Newton-Raphson method. ``"fdpf"`` first runs the
+        fast decoupled (XB) method and falls back to Newton-Raphson, starting from
+        the fast decoupled state, if it has not converged after ``max_iter_fd``
+        iterations. Defaults to ``"nr"``.
+    max_iter_fd : int, optional
+        Maximum number of fast decoupled iterations before the Newton-Raphson
+        fallback. Defaults to ``30``.
+    dtype : numpy dtype, optional
+        Floating point type of the ``solve_batch`` arrays. With ``np.float32`` the
+        first iterations run in single precision (complex64 Ybus, float32
+        Jacobians), halving memory traffic; the arrays are promoted to
+        ``float64`` once the mismatch drops below ``1e-4`` or stops decreasing,
+        and convergence is only declared in double precision. ``solve`` always
+        works in ``float64``. Defaults to ``np.float64``.
+    reuse_jacobian : bool, optional
+        If ``True`` (sparse solver only), the last Jacobian factorization is reused
+        instead of building and factoring a new one while the maximum mismatch
+        shrinks by at least a factor 2 per iteration ("dishonest" Newton).
+        Convergence becomes linear during reuse, but each such step costs only a
+        forward/back substitution. Defaults to ``False``.
     """
 
-    def __init__(self, tol: float = 1e-8, max_iter: int = 100, verbose: bool = False) -> None:
+    def __init__(
+        self,
+        tol: float = 1e-8,
+        max_iter: int = 100,
+        verbose: bool = False,
+        sparse: bool = True,
+        algorithm: str = "nr",
+        max_iter_fd: int = 30,
+        reuse_jacobian: bool = False,
+        dtype=np.float64,
+    ) -> None:
         """Initialize the load-flow solver with algorithm settings."""
+        if algorithm not in ("nr", "fdpf"):
+            raise ValueError(f"Unknown load-flow algorithm: {algorithm!r}")
         self.tol = tol
         self.max_iter = max_iter
         self.verbose = verbose
+        self.sparse = sparse
+        self.algorithm = algorithm
+        self.max_iter_fd = max_iter_fd
+        self.reuse_jacobian = reuse_jacobian
+        self.dtype = np.dtype(dtype)
 
     def solve(self, network: Network) -> LoadFlowResult:
         """
@@ -47,8 +150,8 @@ class LoadFlow:
         ----------
         network : Network
             Power system network containing buses, branches, and shunts. Bus states
-            (voltage magnitude, angle, injections, and limits) are taken from the
-            ``network.buses`` collection.
+            (voltage magnitude, angle and injections) are taken from the network
+            ``bus_arrays`` (initial voltages, injections and reactive limits).
 
         Returns
         -------
@@ -56,69 +159,96 @@ class LoadFlow:
             Dictionary containing the solved voltages, injected powers, number of
             iterations, and a convergence flag. Voltage angles are returned in radians.
 
+        Raises
+        ------
+        ValueError
+            If the network has no slack bus.
+
         Notes
         -----
         Implements the classical Newton-Raphson algorithm with PV reactive power
         limit enforcement. When a PV bus violates its ``Qmin``/``Qmax`` limits it is
         converted to PQ for the remainder of the solve. Convergence is declared when
-        the maximum absolute power mismatch falls below ``tol``.
+        the maximum absolute power mismatch falls below ``tol``. With
+        ``algorithm="fdpf"`` the fast decoupled iterations run first and are
+        counted in ``iterations`` together with any Newton-Raphson fallback ones.
         """
-        Y = build_ybus(network)
-        G, B = Y.real, Y.imag
+        Y = build_ybus(network, refresh_only=True)
+        # kept for post-solve analyses (e.g. PowerFlowReport) on the same network
+        network._ybus_cache = Y
 
         n = network.nbus
-        slack = network.slack_index()
+        network.slack_index()  # raises ValueError if there is no slack bus
         pv = network.pv_indices()
         pq = network.pq_indices()
+        pvpq = network.pvpq_indices()
 
-        Vm = np.array([b.V for b in network.buses], float)
-        Va = np.deg2rad([b.theta_deg for b in network.buses])
+        bus = network.bus_arrays
+        Vm = bus["Vm0"].copy()
+        Va = bus["Va0"].copy()
 
-        P_spec = np.array([b.P for b in network.buses], float)
+        P_spec = bus["P"].copy()
         # Q specified only for PQ; PV has variable Q, Slack is free
-        Q_spec = np.array([b.Q if b.type == BusType.PQ else 0.0 for b in network.buses], float)
-
-        PV_active = set(pv)  # PV with |V| fixed
-        PV_conv = set()      # PV converted to PQ due to Q-limits
-
-        for it in range(self.max_iter):
-            V = Vm * np.exp(1j * Va)
+        Q_spec = np.zeros(n)
+        Q_spec[pq] = bus["Q"][pq]
+
+        pq_mask = np.zeros(n, dtype=bool)
+        pq_mask[pq] = True
+        pv_active = np.zeros(n, dtype=bool)  # PV with |V| fixed
+        pv_active[pv] = True
+        pv_conv = np.zeros(n, dtype=bool)    # PV converted to PQ due to Q-limits
+        Qmin, Qmax = bus["Qmin"], bus["Qmax"]
+        viol_min = np.empty(n, dtype=bool)
+        viol_max = np.empty(n, dtype=bool)
+
+        it_fd = 0
+        if self.algorithm == "fdpf":
+            it_fd, result = self._solve_fdpf(
+                network, Y, Vm, Va, P_spec, Q_spec, pvpq, pq_mask, pv_active, pv_conv
+            )
+            if result is not None:
+                return result
+
+        p_rows = pvpq
+        q_rows = np.flatnonzero(pq_mask | pv_conv)
+        mP = len(p_rows)
+        mismatch = np.empty(mP + len(q_rows))
+        # dense Jacobian buffer, refilled in place every iteration
+        J_buf = None if self.sparse else np.empty((len(mismatch), len(mismatch)))
+
+        jac_lu = None
+        prev_mis = np.inf
+        # one extra pass evaluates the mismatch of the last update, so the
+        # returned P/Q always match the returned voltages
+        last = it_fd + self.max_iter
+        for it in range(it_fd, last + 1):
+            # cos/sin of the angles are shared by the phasors and the Jacobian
+            cos_Va, sin_Va = np.cos(Va), np.sin(Va)
+            V = Vm * (cos_Va + 1j * sin_Va)
             I = Y @ V
             S = V * np.conj(I)
             P = S.real
             Q = S.imag
 
-            # Enforce PV Q-limits -> convert to PQ if necessary
-            for k in list(PV_active):
-                b = network.buses[k]
-
-                if b.Qmin is not None and Q[k] < b.Qmin:
-                    PV_active.remove(k) 
-                    PV_conv.add(k) 
-                    Q_spec[k] = b.Qmin
-                    assert b.type == BusType.PV, "PV bus converted to PQ"
-                    if self.verbose:
-                        print(f"PV bus {k} converted to PQ due to Qmin limit")
-
-                elif b.Qmax is not None and Q[k] > b.Qmax:
-                    PV_active.remove(k)
-                    PV_conv.add(k)
-                    Q_spec[k] = b.Qmax
-                    assert b.type == BusType.PV, "PV bus converted to PQ"
-                    if self.verbose:
-                        print(f"PV bus {k} converted to PQ due to Qmax limit")  
-
-            p_rows = [k for k in range(n) if k != slack]
-            q_rows = sorted(set(pq).union(PV_conv))
-
-            dP = P_spec[p_rows] - P[p_rows]
-            dQ = Q_spec[q_rows] - Q[q_rows]
-            mismatch = np.r_[dP, dQ]
-
+            if self._enforce_q_limits(Q, Q_spec, Qmin, Qmax, pv_active, pv_conv, viol_min, viol_max):
+                q_rows = np.flatnonzero(pq_mask | pv_conv)
+                mismatch = np.empty(mP + len(q_rows))
+                if not self.sparse:
+                    J_buf = np.empty((len(mismatch), len(mismatch)))
+                jac_lu = None  # the Jacobian pattern changes with q_rows
+
+            # mismatch [dP, dQ] written in place into its preallocated buffer
+            dP, dQ = mismatch[:mP], mismatch[mP:]
+            np.take(P_spec, p_rows, out=dP)
+            dP -= P[p_rows]
+            np.take(Q_spec, q_rows, out=dQ)
+            dQ -= Q[q_rows]
+
+            max_mis = max(mismatch.max(), -mismatch.min())  # infinity norm, no temporary
             if self.verbose:
-                print(f"iter {it:02d} | max mismatch = {np.max(np.abs(mismatch)):.3e}")
+                print(f"iter {it:02d} | max mismatch = {max_mis:.3e}")
 
-            if np.max(abs(mismatch)) < self.tol:
+            if max_mis < self.tol:
                 if self.verbose:
                     print(f"Converged in {it} iterations")
                 return LoadFlowResult(
@@ -129,61 +259,320 @@ class LoadFlow:
                     iterations=it,
                     converged=True,
                 )
+            if it == last:
+                break
 
             theta_cols = p_rows
             V_cols = q_rows
-            mP, mQ = len(p_rows), len(q_rows)
-
-            H = np.zeros((mP, len(theta_cols)))
-            N = np.zeros((mP, len(V_cols)))
-            M = np.zeros((mQ, len(theta_cols)))
-            L = np.zeros((mQ, len(V_cols)))
-
-            Va_col = Va[:, None]
-            dth = Va_col - Va_col.T
-            c, s = np.cos(dth), np.sin(dth)
-
-            # Build H and N (rows = P mismatch)
-            for ri, k in enumerate(p_rows):
-                Vk = Vm[k]
-                # H diag and off-diag
-                H[ri, theta_cols.index(k)] = -Q[k] - (Vk ** 2) * B[k, k]
-                for m in theta_cols:
-                    if m == k:
-                        continue
-                    H[ri, theta_cols.index(m)] = Vk * Vm[m] * (G[k, m] * s[k, m] - B[k, m] * c[k, m])
-                # N diag and off-diag
-                if k in V_cols:
-                    N[ri, V_cols.index(k)] = (P[k] / max(Vk, 1e-12)) + Vk * G[k, k]
-                for m in V_cols:
-                    if m == k:
-                        continue
-                    N[ri, V_cols.index(m)] = Vk * (G[k, m] * c[k, m] + B[k, m] * s[k, m])
-
-            # Build M and L (rows = Q mismatch)
-            for ri, k in enumerate(q_rows):
-                Vk = Vm[k]
-                # M diag and off-diag
-                M[ri, theta_cols.index(k)] = P[k] - (Vk ** 2) * G[k, k]
-                for m in theta_cols:
-                    if m == k:
-                        continue
-                    M[ri, theta_cols.index(m)] = -Vk * Vm[m] * (G[k, m] * c[k, m] + B[k, m] * s[k, m])
-                # L diag and off-diag
-                L[ri, V_cols.index(k)] = (Q[k] / max(Vk, 1e-12)) - Vk * B[k, k]
-                for m in V_cols:
-                    if m == k:
-                        continue
-                    L[ri, V_cols.index(m)] = Vk * (G[k, m] * s[k, m] - B[k, m] * c[k, m])
-
-            J = np.block([[H, N], [M, L]])
-            dx = np.linalg.solve(J, mismatch)
+
+            if self.sparse:
+                # dishonest Newton: keep the old factorization while it still
+                # contracts the mismatch fast (never across a pattern change)
+                reuse = self.reuse_jacobian and jac_lu is not None and max_mis < 0.5 * prev_mis
+                if not reuse:
+                    J = build_jacobian(Y, Vm, Va, P, Q, p_rows, q_rows, cos_Va, sin_Va)
+                    if jac_lu is None:
+                        jac_lu = _JacobianLU()
+                    jac_lu.factor(J)
+                dx = jac_lu.solve(mismatch)
+            else:
+                J = build_jacobian_dense(Y, Vm, Va, P, Q, p_rows, q_rows, cos_Va, sin_Va, out=J_buf)
+                # J is C-contiguous, so J.T is the Fortran-ordered array LAPACK
+                # factors in place: solve (J.T).T dx = mismatch without copies
+                dx = la_solve(
+                    J.T, mismatch, transposed=True,
+                    overwrite_a=True, overwrite_b=True, check_finite=False,
+                )
 
             Va[theta_cols] += dx[:mP]
             Vm[V_cols] += dx[mP:]
+            prev_mis = max_mis
 
             # Re-impose |V| on PV still active
-            for k in PV_active:
-                Vm[k] = network.buses[k].V
+            Vm[pv_active] = bus["Vm0"][pv_active]
+
+        return LoadFlowResult(Vm=Vm, Va=Va, P=P, Q=Q, iterations=last, converged=False)
+
+    def solve_batch(self, networks: list[Network], gpu: bool = True) -> list[LoadFlowResult]:
+        """
+        Solve many load flows on networks sharing the same bus layout at once.
+
+        Parameters
+        ----------
+        networks : list of Network
+            Networks with the same number of buses and the same bus types (e.g.
+            contingency or time-series variants of one case). Branch data,
+            injections, setpoints and reactive limits may differ.
+        gpu : bool, optional
+            If ``True`` and cupy is installed, all the batch arrays live on the GPU
+            for the whole solve. Otherwise NumPy is used. Defaults to ``True``.
+
+        Returns
+        -------
+        list of LoadFlowResult
+            One result per network, in input order, as returned by ``solve``.
+
+        Raises
+        ------
+        ValueError
+            If the networks do not share the same bus types.
+
+        Notes
+        -----
+        Every sample uses the same unknowns (angle and magnitude of all non-slack
+        buses), so the Jacobians stack into a ``(batch, 2m, 2m)`` dense array
+        solved by a single batched ``linalg.solve`` per iteration. The reactive
+        equation of a PV bus still regulating its voltage is replaced by
+        ``dVm = 0``, which lets PV to PQ conversions differ between samples
+        without changing the system size. Dense ``(batch, n, n)`` admittance
+        matrices are used, so the method targets many small/medium networks.
+        Samples stop being updated once converged.
+        """
+        xp = cp if gpu and cp is not None else np
+        ref = networks[0]
+        for net in networks[1:]:
+            if not np.array_equal(net.bus_type_code, ref.bus_type_code):
+                raise ValueError("solve_batch requires networks with the same bus types")
+
+        pvpq = ref.pvpq_indices()
+        pv = ref.pv_indices()
+        pq = ref.pq_indices()
+        m = len(pvpq)
+        nb = len(networks)
+
+        def stack(attr):
+            return xp.asarray(np.stack([getattr(net, attr) for net in networks]))
+
+        Y64 = xp.asarray(np.stack([build_ybus(net, refresh_only=True).toarray() for net in networks]))
+        Vm, Va = stack("bus_V"), stack("bus_theta")
+        V_set64 = Vm.copy()
+        P_spec = stack("bus_P")
+        Q_spec = xp.zeros_like(P_spec)
+        Q_spec[:, pq] = stack("bus_Q")[:, pq]
+        Qmin, Qmax = stack("bus_Qmin"), stack("bus_Qmax")
+
+        pv_active = xp.zeros(Vm.shape, dtype=bool)
+        pv_active[:, pv] = True
+
+        converged = xp.zeros(nb, dtype=bool)
+        iterations = xp.full(nb, self.max_iter)
+
+        # working precision of the state and the Jacobian; the specified
+        # injections and limits always stay in float64
+        def set_precision(dt):
+            Y = Y64.astype(np.result_type(dt, np.complex64), copy=False)
+            G, B = Y.real, Y.imag
+            return (
+                dt, Y, G, B,
+                xp.diagonal(G, axis1=1, axis2=2), xp.diagonal(B, axis1=1, axis2=2),
+                V_set64.astype(dt, copy=False), xp.eye(m, dtype=dt),
+            )
+
+        work, Y, G, B, Gd, Bd, V_set, eye_m = set_precision(self.dtype)
+        Va0 = Va
+        Vm, Va = Vm.astype(work, copy=False), Va.astype(work, copy=False)
+        prev_worst = np.inf
+
+        # one extra pass checks the last update without building a Jacobian
+        for it in range(self.max_iter + 1):
+            while True:
+                cos_Va, sin_Va = xp.cos(Va), xp.sin(Va)
+                V = Vm * (cos_Va + 1j * sin_Va)
+                S = V * xp.conj(xp.matmul(Y, V[..., None])[..., 0])
+                P, Q = S.real, S.imag
+
+                # PV reactive limits, per sample (converged samples are frozen)
+                live = ~converged[:, None]
+                viol_min = live & pv_active & (Q < Qmin)
+                viol_max = live & pv_active & (Q > Qmax)
+                pv_active &= ~(viol_min | viol_max)
+                Q_spec = xp.where(viol_min, Qmin, xp.where(viol_max, Qmax, Q_spec))
+
+                dP = (P_spec - P)[:, pvpq]
+                dQ = xp.where(pv_active, 0.0, Q_spec - Q)[:, pvpq]
+                mismatch = xp.concatenate([dP, dQ], axis=1)
+
+                max_mis = xp.max(xp.abs(mismatch), axis=1)
+                if work == np.float64:
+                    break
+                # leave single precision near the solution or when it stagnates,
+                # then repeat the pass so that the mismatch is computed in float64
+                worst = float(xp.max(max_mis))
+                promote = worst < 1e-4 or worst > 0.5 * prev_worst
+                prev_worst = worst
+                if not promote:
+                    break
+                work, Y, G, B, Gd, Bd, V_set, eye_m = set_precision(np.dtype(np.float64))
+                # the specified slack and PV voltages are taken back exactly
+                Vm_new, Va_new = V_set64.copy(), Va0.copy()
+                Vm_new[:, pvpq], Va_new[:, pvpq] = Vm[:, pvpq], Va[:, pvpq]
+                Vm, Va = xp.where(pv_active, V_set, Vm_new), Va_new
+                if self.verbose:
+                    print(f"iter {it:02d} | switching to float64")
+
+            newly = ~converged & (max_mis < self.tol) & (work == np.float64)
+            iterations = xp.where(newly, it, iterations)
+            converged |= newly
+            if self.verbose:
+                print(f"iter {it:02d} | max mismatch = {float(xp.max(max_mis)):.3e} | converged {int(converged.sum())}/{nb}")
+            if bool(converged.all()) or it == self.max_iter:
+                break
+
+            # dense Jacobian blocks of every sample
+            c = cos_Va[:, :, None] * cos_Va[:, None, :] + sin_Va[:, :, None] * sin_Va[:, None, :]
+            s_ = sin_Va[:, :, None] * cos_Va[:, None, :] - cos_Va[:, :, None] * sin_Va[:, None, :]
+            GsBc = G * s_ - B * c
+            GcBs = G * c + B * s_
+            Vk = Vm[:, :, None]
+            VV = Vk * Vm[:, None, :]
+            Vsafe = xp.maximum(Vm, 1e-12)
+
+            H = VV * GsBc
+            N = Vk * GcBs
+            M = -VV * GcBs
+            L = Vk * GsBc
+            diag = xp.arange(Vm.shape[1])
+            H[:, diag, diag] = -Q - Vm**2 * Bd
+            N[:, diag, diag] = P / Vsafe + Vm * Gd
+            M[:, diag, diag] = P - Vm**2 * Gd
+            L[:, diag, diag] = Q / Vsafe - Vm * Bd
+
+            sub = xp.ix_(pvpq, pvpq)
+            H, N, M, L = H[:, sub[0], sub[1]], N[:, sub[0], sub[1]], M[:, sub[0], sub[1]], L[:, sub[0], sub[1]]
+
+            # regulated PV buses: Q row becomes dVm = 0
+            reg = pv_active[:, pvpq][:, :, None]
+            M = xp.where(reg, 0.0, M)
+            L = xp.where(reg, eye_m, L)
+
+            J = xp.concatenate([xp.concatenate([H, N], axis=2), xp.concatenate([M, L], axis=2)], axis=1)
+            dx = xp.linalg.solve(J, mismatch.astype(work, copy=False)[..., None])[..., 0]
+            dx[converged] = 0.0
+
+            Va[:, pvpq] += dx[:, :m]
+            Vm[:, pvpq] += dx[:, m:]
+            Vm = xp.where(pv_active, V_set, Vm)
+
+        to_np = cp.asnumpy if xp is not np else np.asarray
+        # float64 results also when the iterations stopped in single precision
+        Vm, Va, P, Q = (to_np(a).astype(np.float64, copy=False) for a in (Vm, Va, P, Q))
+        iterations, converged = to_np(iterations), to_np(converged)
+        return [
+            LoadFlowResult(
+                Vm=Vm[b].copy(),
+                Va=Va[b].copy(),
+                P=P[b].copy(),
+                Q=Q[b].copy(),
+                iterations=int(iterations[b]),
+                converged=bool(converged[b]),
+            )
+            for b in range(nb)
+        ]
+
+    def _enforce_q_limits(self, Q, Q_spec, Qmin, Qmax, pv_active, pv_conv, viol_min, viol_max) -> bool:
+        """
+        Convert to PQ the active PV buses whose reactive injection is out of limits.
+
+        ``Qmin``/``Qmax`` are the bus limits (``-inf``/``+inf`` when unset).
+        ``Q_spec`` and the boolean masks ``pv_active`` and ``pv_conv`` are updated
+        in place; ``viol_min``/``viol_max`` are boolean work buffers of length
+        ``nbus``. Returns ``True`` if at least one bus was converted.
+        """
+        np.less(Q, Qmin, out=viol_min)
+        viol_min &= pv_active
+        np.greater(Q, Qmax, out=viol_max)
+        viol_max &= pv_active
+        if not (viol_min.any() or viol_max.any()):
+            return False
+
+        np.copyto(Q_spec, Qmin, where=viol_min)
+        np.copyto(Q_spec, Qmax, where=viol_max)
+        pv_conv |= viol_min
+        pv_conv |= viol_max
+        pv_active &= ~pv_conv
+
+        if self.verbose:
+            for k in np.flatnonzero(viol_min):
+                print(f"PV bus {k} converted to PQ due to Qmin limit")
+            for k in np.flatnonzero(viol_max):
+                print(f"PV bus {k} converted to PQ due to Qmax limit")
+        return True
+
+    def _solve_fdpf(self, network, Y, Vm, Va, P_spec, Q_spec, pvpq, pq_mask, pv_active, pv_conv):
+        """
+        Fast decoupled (XB) iterations, updating ``Vm`` and ``Va`` in place.
+
+        Returns
+        -------
+        tuple
+            ``(iterations, result)``: ``result`` is a ``LoadFlowResult`` if the
+            method converged, ``None`` otherwise (``Vm``/``Va`` then hold the last
+            iterate, used as starting point by Newton-Raphson).
+
+        Notes
+        -----
+        XB scheme: ``B'`` is built from the branch series reactances alone and
+        restricted to the non-slack buses, ``B''`` is ``-imag(Y)`` restricted to
+        the PQ buses. Both are factored once; ``B''`` is refactored only
+        when a PV bus is converted to PQ by its reactive limits.
+        """
+        Qmin, Qmax = network.bus_Qmin, network.bus_Qmax
+        viol_min = np.empty(network.nbus, dtype=bool)
+        viol_max = np.empty(network.nbus, dtype=bool)
+
+        Bm = (-Y.imag).tocsr()
+        # XB: B' from the series reactances only (no resistance, charging, shunts
+        # or off-nominal taps)
+        n = network.nbus
+        i, j = network.br_i, network.br_j
+        bx = 1.0 / network.br_x
+        Bp = sp.coo_matrix(
+            (np.concatenate([bx, bx, -bx, -bx]), (np.concatenate([i, j, i, j]), np.concatenate([i, j, j, i]))),
+            shape=(n, n),
+        ).tocsr()
+        lu_p = splu(Bp[pvpq][:, pvpq].tocsc())
+        lu_pp = None
+
+        for it in range(self.max_iter_fd):
+            V = Vm * np.exp(1j * Va)
+            S = V * np.conj(Y @ V)
+            P, Q = S.real, S.imag
+
+            changed = self._enforce_q_limits(Q, Q_spec, Qmin, Qmax, pv_active, pv_conv, viol_min, viol_max)
+            q_rows = np.flatnonzero(pq_mask | pv_conv)
+
+            dP = P_spec[pvpq] - P[pvpq]
+            dQ = Q_spec[q_rows] - Q[q_rows]
+            max_mis = max(np.max(np.abs(dP), initial=0.0), np.max(np.abs(dQ), initial=0.0))
+
+            if self.verbose:
+                print(f"fdpf iter {it:02d} | max mismatch = {max_mis:.3e}")
+
+            if max_mis < self.tol:
+                if self.verbose:
+                    print(f"Converged in {it} fast decoupled iterations")
+                return it, LoadFlowResult(
+                    Vm=Vm.copy(),
+                    Va=Va.copy(),
+                    P=P.copy(),
+                    Q=Q.copy(),
+                    iterations=it,
+                    converged=True,
+                )
+
+            # P-theta half iteration
+            Va[pvpq] += lu_p.solve(dP / Vm[pvpq])
+
+            # Q-V half iteration, with the mismatch at the updated angles
+            if len(q_rows):
+                if lu_pp is None or changed:
+                    lu_pp = splu(Bm[q_rows][:, q_rows].tocsc())
+                V = Vm * np.exp(1j * Va)
+                Q = (V * np.conj(Y @ V)).imag
+                Vm[q_rows] += lu_pp.solve((Q_spec[q_rows] - Q[q_rows]) / Vm[q_rows])
+
+            Vm[pv_active] = network.bus_V[pv_active]
 
-        return LoadFlowResult(Vm=Vm, Va=Va, P=P, Q=Q, iterations=self.max_iter, converged=False)
+        if self.verbose:
+            print(f"Fast decoupled not converged in {self.max_iter_fd} iterations, switching to Newton-Raphson")
+        return self.max_iter_fd, None
@@ -1,9 +1,56 @@
 from typing import Any
 import numpy as np
 import matplotlib.pyplot as plt
+from powerflow.elements.bus import BusType
+from powerflow.math._flows_kernel import branch_flows as _compiled_branch_flows
 from powerflow.math.ybus import build_ybus
 from powerflow.network.network import Network
 
+
+def _branch_flows(br_i, br_j, br_r, br_x, br_b, br_tap, br_shift, V, base_mva):
+    """
+    Compute the pi-model power flows of every branch.
+
+    Parameters
+    ----------
+    br_i, br_j, br_r, br_x, br_b, br_tap, br_shift : numpy.ndarray
+        Branch arrays of the network (see ``Network``); a zero tap is treated as 1.
+    V : numpy.ndarray
+        Complex bus voltage phasors (p.u.).
+    base_mva : float
+        System base power, used to convert the flows to MW/MVAr.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        ``(P_ij, Q_ij, P_ji, Q_ji, losses)`` of every branch, with
+        ``losses = P_ij + P_ji``.
+
+    Notes
+    -----
+    When numba is installed, the flows are computed by a compiled loop that
+    fuses the complex arithmetic of each branch; otherwise with NumPy ufuncs.
+    """
+    if _compiled_branch_flows is not None:
+        return _compiled_branch_flows(br_i, br_j, br_r, br_x, br_b, br_tap, br_shift, V, float(base_mva))
+
+    y_series = 1 / (br_r + 1j * br_x)
+    y_shunt = 1j * (br_b / 2)
+    tap_c = np.where(br_tap != 0, br_tap, 1.0) * np.exp(1j * br_shift)
+
+    Vi = V[br_i]
+    Vj = V[br_j]
+    Vi_t = Vi / tap_c
+
+    Iij = (Vi_t - Vj) * y_series + Vi_t * y_shunt
+    Sij = Vi * np.conj(Iij) * base_mva
+
+    Iji = (Vj - Vi_t) * y_series + Vj * y_shunt
+    Sji = Vj * np.conj(Iji) * base_mva
+
+    return Sij.real, Sij.imag, Sji.real, Sji.imag, Sij.real + Sji.real
+
+
 class PowerFlowReport:
     def __init__(self, network: Network, Vm: np.ndarray, Va: np.ndarray, P: np.ndarray, Q: np.ndarray):
         """
@@ -30,12 +77,15 @@ class PowerFlowReport:
         -----
         All input arrays are converted to numpy arrays internally for computation.
         The arrays should be ordered by bus index (0-based).
+        The complex voltage phasors are computed once and stored in ``V``.
         """
         self.net = network
-        self.Vm = np.array(Vm)
-        self.Va = np.array(Va)
-        self.P = np.array(P)
-        self.Q = np.array(Q)
+        self.Vm = np.asarray(Vm, dtype=float)
+        self.Va = np.asarray(Va, dtype=float)
+        self.P = np.asarray(P, dtype=float)
+        self.Q = np.asarray(Q, dtype=float)
+        # complex voltage phasors V = |V| * exp(j*theta)
+        self.V = self.Vm * np.exp(1j * np.deg2rad(self.Va))
 
     def plot_voltage_profile(self):
         """
@@ -91,9 +141,10 @@ class PowerFlowReport:
         to display the figure.
         If no generators are found (all P <= 0), the chart will be empty.
         """
-        gens = [b for b in self.net.buses if b.P > 0]
-        labels = [f"Bus {b.idx+1}" for b in gens]
-        values = [b.P for b in gens]
+        bus = self.net.bus_arrays
+        gens = np.flatnonzero(bus["P"] > 0)
+        labels = [f"Bus {k+1}" for k in self.net.bus_idx[gens]]
+        values = bus["P"][gens]
 
         plt.figure()
         plt.pie(values, labels=labels, autopct="%1.1f%%")
@@ -105,7 +156,8 @@ class PowerFlowReport:
         
         Creates a bar chart showing the active power flow (P_ij) from bus i to
         bus j for each branch. Power flows are calculated using the Ybus matrix
-        and the solved voltage profile.
+        and the solved voltage profile. The Ybus built by the last
+        ``LoadFlow.solve`` on the network is reused when available.
         
         Notes
         -----
@@ -114,36 +166,21 @@ class PowerFlowReport:
         Power flows are displayed in MW (converted from per-unit using base_mva).
         Positive values indicate power flowing from bus i to bus j.
         """
-        # calcolo flussi P_ij usando V e Ybus
-        Y = build_ybus(self.net)
-        S = np.zeros((len(self.net.branches), 2))  # P_ij, P_ji
-
-        # Build complex voltage phasor vector: V = |V| * exp(j*theta)
-        # Converts from polar form (magnitude + angle) to complex form
-        V = np.array([self.Vm[k] * np.exp(1j * np.deg2rad(self.Va[k])) for k in range(len(self.Vm))])
-        
-        for k, br in enumerate(self.net.branches):
-            i, j = br.i, br.j
-            Vi = V[i]
-            Vj = V[j]
-            
-            # Calculate current from i to j using Ybus
-            # Iij = Y[i,j] * Vj (current injected at i due to j)
-            # But we want the actual branch current, so we use the off-diagonal element
-            if Y[i, j] != 0:
-                # Current flowing from i to j through the branch
-                Iij = -Y[i, j] * Vj  # Negative because Y[i,j] is negative of branch admittance
-                Sij = Vi * np.conj(Iij)
-                S[k, 0] = Sij.real * self.net.base_mva  # Convert to MW
-                
-                # Reverse flow
-                Iji = -Y[j, i] * Vi
-                Sji = Vj * np.conj(Iji)
-                S[k, 1] = Sji.real * self.net.base_mva
-            else:
-                # Fallback for disconnected branches
-                S[k, 0] = 0.0
-                S[k, 1] = 0.0
+        # calcolo flussi P_ij usando V e Ybus (quella del solve, se disponibile)
+        Y = self.net._ybus_cache
+        if Y is None:
+            Y = build_ybus(self.net)
+        V = self.V
+        i, j = self.net.br_i, self.net.br_j
+
+        # off-diagonal Ybus element of every branch, zero for disconnected branches
+        Yij = np.asarray(Y[i, j]).ravel()
+        Yji = np.asarray(Y[j, i]).ravel()
+
+        # Iij = -Y[i,j] * Vj: negative because Y[i,j] is the negative of the branch admittance
+        S = np.empty((len(i), 2))  # P_ij, P_ji
+        S[:, 0] = (V[i] * np.conj(-Yij * V[j])).real * self.net.base_mva
+        S[:, 1] = (V[j] * np.conj(-Yji * V[i])).real * self.net.base_mva
 
         plt.figure()
         plt.bar(range(len(S)), S[:,0])
@@ -186,9 +223,7 @@ class PowerFlowReport:
         """
 
         
-        # Build complex voltage phasor vector: V = |V| * exp(j*theta)
-        # Converts from polar form (magnitude + angle) to complex form
-        V = np.array([self.Vm[k] * np.exp(1j * np.deg2rad(self.Va[k])) for k in range(len(self.Vm))])
+        V = self.V
 
         print("\n" + "="*140)
         print("BRANCH POWER FLOWS")
@@ -196,34 +231,21 @@ class PowerFlowReport:
         print(f"{'Branch':<8} {'From':<6} {'From type':<10} {'To':<6} {'To type':<10} {'Vi (p.u.)':<12} {'Vj (p.u.)':<12} {'P_ij (MW)':<12} {'Q_ij (MVAr)':<12} {'P_ji (MW)':<12} {'Q_ji (MVAr)':<12} {'Losses (MW)':<12}")
         print("-"*140)
 
-        total_losses = 0.0
-
-        for k, br in enumerate(self.net.branches):
-            i, j = br.i, br.j
-
-            y_series = 1 / (br.r + 1j * br.x)
-            y_shunt = 1j * (br.b / 2)
-
-            tap = br.tap if br.tap != 0 else 1.0
-            tap_c = tap * np.exp(1j * np.deg2rad(br.shift_deg))
-
-            Vi = V[i]
-            Vj = V[j]
-
-            Iij = ((Vi / tap_c) - Vj) * y_series + (Vi / tap_c) * y_shunt
-            Sij = Vi * np.conj(Iij) * self.net.base_mva
-
-            Iji = ((Vj - Vi / tap_c) * y_series) + (Vj * y_shunt)
-            Sji = Vj * np.conj(Iji) * self.net.base_mva
-
-            P_ij, Q_ij = Sij.real, Sij.imag
-            P_ji, Q_ji = Sji.real, Sji.imag
-
-            # losses are the difference between the injected power and the received power. Since one is the opposite of the other (minus the losses), adding them gives the losses.
-            losses = P_ij + P_ji 
-            total_losses += losses
+        net = self.net
+        P_ij, Q_ij, P_ji, Q_ji, losses = _branch_flows(
+            net.br_i, net.br_j, net.br_r, net.br_x, net.br_b, net.br_tap, net.br_shift, V, net.base_mva
+        )
+        # losses are the difference between the injected power and the received power. Since one is the opposite of the other (minus the losses), adding them gives the losses.
+        total_losses = losses.sum()
 
-            print(f"{k+1:<8} {i+1:<6} {self.net.buses[i].type:<10} {j+1:<6} {self.net.buses[j].type:<10} {Vi.real:>11.4f} {Vj.real:>11.4f} {P_ij:>11.4f} {Q_ij:>11.4f} {P_ji:>11.4f} {Q_ji:>11.4f} {losses:>11.4f}")
+        names = BusType.NAMES
+        code = net.bus_type_code
+        rows = zip(
+            net.br_i.tolist(), net.br_j.tolist(), V.real[net.br_i].tolist(), V.real[net.br_j].tolist(),
+            P_ij.tolist(), Q_ij.tolist(), P_ji.tolist(), Q_ji.tolist(), losses.tolist(),
+        )
+        for k, (i, j, Vi, Vj, pij, qij, pji, qji, loss) in enumerate(rows):
+            print(f"{k+1:<8} {i+1:<6} {names[code[i]]:<10} {j+1:<6} {names[code[j]]:<10} {Vi:>11.4f} {Vj:>11.4f} {pij:>11.4f} {qij:>11.4f} {pji:>11.4f} {qji:>11.4f} {loss:>11.4f}")
 
         print("-"*140)
         print(f"{'TOTAL LOSSES:':<20} {total_losses:>11.4f} MW")